@@ -7,10 +7,13 @@ import json
 import logging
 import threading
 import re
-from bs4 import BeautifulSoup
 import queue
+import functools
 from PIL import Image, ImageDraw
 import datetime # Added import
+import http.cookiejar
+
+from text_utils import fit_text
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -22,9 +25,38 @@ bulletin_cache_loaded_from_file = False # ADDED: Flag to track if cache has been
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     requests = None
 
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+# Keep-alive HTTP session for the bulletin page and the headline API. It never
+# stores or sends cookies: if Lionel sees login cookies it redirects away from the bulletin
+if requests:
+    http_session = requests.Session()
+    http_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    http_session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2))
+else:
+    http_session = None
+
+# Use lxml's tree builder for BeautifulSoup if it is installed, it is much faster than html.parser
+try:
+    import lxml
+    BULLETIN_HTML_PARSER = "lxml"
+except ImportError:
+    BULLETIN_HTML_PARSER = "html.parser"
+
+# Patterns used to filter bulletin items, compiled once
+Y9_TARGETING_RE = re.compile(r"Targeting.*(?:Yr|Year) 9")
+Y9_MENTION_RE = re.compile(r"\b(?:Year 9|Yr 9|Y9)\b")
+Y9_STUDENT_ID_RE = re.compile(r"\b09[A-Z]\d+\b|\[09[A-Z]\d+\]")
+STUDENT_ID_RE = re.compile(r'\[\d+[A-Z]\d+\]')
+BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
 # Constants
 BULLETIN_URL = "https://lionel2.kgv.edu.hk/local/mis/bulletin/bulletin.php"
 BULLETIN_UPDATE_INTERVAL = 1800  # Update bulletin every 30 minutes (1800 seconds)
@@ -35,6 +67,30 @@ BULLETIN_CACHE_FILE = os.path.join(SCRIPT_DIR, 'bulletin_cache.json') # ADDED: C
 UPDATE_HOUR_1 = 8
 UPDATE_HOUR_2 = 16
 
+# Last rendered bulletin frame (upright), used to skip identical redraws
+_prev_bulletin_state = None
+_prev_bulletin_image = None
+# (fonts, size, image) with the header bar and Next button, which are the same on every frame
+_bulletin_chrome = (None, None, None)
+
+# Bulletin list rows: text must stop short of the clickable indicator at x=255
+LIST_HEADLINE_MAX_PX = 245  # Headline starts at x=5
+LIST_PREVIEW_MAX_PX = 235  # Preview starts at x=15
+PREVIEW_SOURCE_CHARS = 120  # Far more than fits on one line, so the pixel fit always has enough text
+
+@functools.lru_cache(maxsize=128)
+def _preview_source(content):
+    """Return the one-line preview source shown under an item in the bulletin list.
+
+    Cached by the content text rather than stored on the item, so the derived
+    string never ends up in the saved cache. It is clipped to the row width with
+    fit_text when drawn, since that needs the font.
+    """
+    # Replace all newlines with spaces and collapse repeated whitespace for single line display
+    content_preview = content.strip().replace("\n", " ").replace("\\n", " ")
+    content_preview = " ".join(content_preview.split())
+    return content_preview[:PREVIEW_SOURCE_CHARS]
+
 # ADDED HELPER FUNCTIONS TO LOAD AND SAVE CACHE FROM/TO FILE
 def _load_bulletin_from_file():
     """Load bulletin data from cache file if it exists."""
@@ -123,13 +179,16 @@ def fetch_bulletin_items(max_items=10):
     if not requests:
         logging.error("Requests module not available")
         return []
+    if BeautifulSoup is None:
+        logging.error("BeautifulSoup (bs4) not available")
+        return []
     
     try:
         logging.info(f"Fetching bulletin from: {BULLETIN_URL}")
         
         # Important: NEVER use session cookies for bulletin page
         # If user is logged in, the page redirects to home instead of showing the bulletin
-        response = requests.get(BULLETIN_URL, timeout=10)
+        response = http_session.get(BULLETIN_URL, timeout=10)
         response.raise_for_status()
         
         # Check if we were redirected (which happens if cookies were sent)
@@ -142,7 +201,7 @@ def fetch_bulletin_items(max_items=10):
             response = session.get(BULLETIN_URL, timeout=10)
             response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(response.content, BULLETIN_HTML_PARSER)
         
         # Find the main bulletin content area
         main_content = soup.find("div", class_="studentbuletin")
@@ -180,7 +239,7 @@ def fetch_bulletin_items(max_items=10):
                         is_targeted_to_specific_years = True
                         
                         # Check if it targets Year 9
-                        if re.search(r"Targeting.*Yr 9", meta_text) or re.search(r"Targeting.*Year 9", meta_text):
+                        if Y9_TARGETING_RE.search(meta_text):
                             is_targeted_to_y9 = True
             
             # Check content for explicit Year 9 mentions
@@ -188,11 +247,11 @@ def fetch_bulletin_items(max_items=10):
             if item_text:
                 text_content = item_text.get_text()
                 # Look for Year 9 specific mentions
-                if re.search(r"\bYear 9\b", text_content) or re.search(r"\bYr 9\b", text_content) or re.search(r"\bY9\b", text_content):
+                if Y9_MENTION_RE.search(text_content):
                     is_targeted_to_y9 = True
                 
                 # Check for student IDs from Year 9
-                if re.search(r"\b09[A-Z]\d+\b", text_content) or re.search(r"\[09[A-Z]\d+\]", text_content):
+                if Y9_STUDENT_ID_RE.search(text_content):
                     is_targeted_to_y9 = True
             
             # Check if this item is relevant for Year 9:
@@ -269,7 +328,7 @@ def fetch_bulletin_items(max_items=10):
                 
             # Clean up the text content
             text_content = item_text.get_text()
-            text_content = re.sub(r'\n\s*\n', '\n\n', text_content)
+            text_content = BLANK_LINES_RE.sub('\n\n', text_content)
             text_content = text_content.strip()
             
             # Generate a headline using AI (with fallback)
@@ -285,11 +344,12 @@ def fetch_bulletin_items(max_items=10):
             meta_text = meta.get_text(strip=True) if meta else ""
             
             # Store the processed item
-            processed_bulletin_items.append({ # MODIFIED: Appending to processed_bulletin_items
+            processed_item = {
                 "headline": headline,
                 "content": text_content, # Ensure full content is stored
                 "meta": meta_text
-            })
+            }
+            processed_bulletin_items.append(processed_item)
         
         # Update cache
         cached_bulletin_items = processed_bulletin_items # MODIFIED: Store the FULL list in global cache
@@ -312,7 +372,7 @@ def is_from_student(item):
     meta_text = meta.get_text()
     
     # Check for student ID pattern [XXYXX]
-    if re.search(r'\[\d+[A-Z]\d+\]', meta_text):
+    if STUDENT_ID_RE.search(meta_text):
         return True
     
     # Check for Teacher Supervisor text
@@ -415,7 +475,7 @@ def generate_headline(text, max_retries=2):
                 "messages": [{"role": "user", "content": prompt}]
             }
             
-            response = requests.post(api_url, headers=headers, json=data, timeout=15)
+            response = http_session.post(api_url, headers=headers, json=data, timeout=15)
             
             # Check for successful response
             if response.status_code == 200:
@@ -464,8 +524,12 @@ def generate_headline(text, max_retries=2):
     # Fallback if somehow we exit the loop
     return create_fallback_headline(text)
 
-def bulletin_thread_function(bulletin_queue, bulletin_thread_running):
-    """Thread function for fetching bulletin items in the background"""
+def bulletin_thread_function(bulletin_queue, bulletin_thread_running, wake_event=None):
+    """Thread function for fetching bulletin items in the background
+
+    If wake_event is given it is set after each new batch is queued, so the
+    consumer can sleep on it instead of polling the queue.
+    """
     logging.info("Bulletin fetch thread started")
     
     # Get initial bulletin items immediately
@@ -476,6 +540,8 @@ def bulletin_thread_function(bulletin_queue, bulletin_thread_running):
         
         # Put the result in the queue
         bulletin_queue.put(bulletin_items)
+        if wake_event is not None:
+            wake_event.set()
         logging.info(f"Thread: Initially fetched {len(bulletin_items)} bulletin items")
     except Exception as e:
         logging.error(f"Thread: Error in initial bulletin fetch: {e}")
@@ -499,6 +565,8 @@ def bulletin_thread_function(bulletin_queue, bulletin_thread_running):
             
             # Add the new items
             bulletin_queue.put(bulletin_items)
+            if wake_event is not None:
+                wake_event.set()
             logging.info(f"Thread: Fetched {len(bulletin_items)} bulletin items")
             
             # Sleep in short intervals to check for shutdown request
@@ -517,7 +585,25 @@ def bulletin_thread_function(bulletin_queue, bulletin_thread_running):
     
     logging.info("Bulletin fetch thread exiting")
 
-def draw_bulletin_screen(epd, fonts, bulletin_items, current_time=None, current_date=None, scroll_position=0, selected_item=None, content_scroll_position=0, config=None):
+def _new_bulletin_image(epd, fonts):
+    """Return a fresh copy of the bulletin frame with its static header already drawn"""
+    global _bulletin_chrome
+    cached_fonts, cached_size, chrome = _bulletin_chrome
+    size = (epd.height, epd.width)
+    if cached_fonts is not fonts or cached_size != size:
+        font_lg, font_md, font_sm, font_xs = fonts
+        chrome = Image.new('1', size, 255)
+        draw = ImageDraw.Draw(chrome)
+        # Header bar with the time/date divider
+        draw.rectangle([(0, 0), (epd.height, 15)], outline=0, fill=0)
+        draw.text((epd.height//2 - 10, 1), "|", font=font_sm, fill=255)
+        # Next button in the top right
+        draw.rectangle([(270, 0), (295, 15)], outline=0, fill=0)
+        draw.text((273, 1), "Next", font=font_xs, fill=255)
+        _bulletin_chrome = (fonts, size, chrome)
+    return chrome.copy()
+
+def draw_bulletin_screen(epd, fonts, bulletin_items, current_time=None, current_date=None, scroll_position=0, selected_item=None, content_scroll_position=0):
     """Draw the bulletin screen with headlines and content
     
     Args:
@@ -529,16 +615,13 @@ def draw_bulletin_screen(epd, fonts, bulletin_items, current_time=None, current_
         scroll_position: Vertical scroll position (in number of items)
         selected_item: Index of currently selected item to show full content, or None
         content_scroll_position: Scroll position for content when viewing an item
-        config: Display configuration (for rotation)
         
     Returns:
-        PIL Image object with the rendered bulletin
+        Upright PIL Image object with the rendered bulletin; the frame packer
+        applies the panel rotation. It is the same object handed back for the
+        next identical redraw, so callers must not draw on it
     """
-    from PIL import Image, ImageDraw
-    
-    font_lg, font_md, font_sm, font_xs = fonts
-    image = Image.new('1', (epd.height, epd.width), 255)
-    draw = ImageDraw.Draw(image)
+    global _prev_bulletin_state, _prev_bulletin_image
     
     # Get current time and date if not provided
     if current_time is None or current_date is None:
@@ -546,25 +629,38 @@ def draw_bulletin_screen(epd, fonts, bulletin_items, current_time=None, current_
         current_time = time.strftime("%H:%M", now)
         current_date = time.strftime("%d/%m/%Y", now)
     
-    # Create a header with time and date in a top bar
-    draw.rectangle([(0, 0), (epd.height, 15)], outline=0, fill=0)
+    # Nothing that affects the frame has changed - hand back the previous frame untouched
+    state = (tuple(bulletin_items), current_time, current_date,
+             scroll_position, selected_item, content_scroll_position)
+    if state == _prev_bulletin_state and _prev_bulletin_image is not None:
+        image = _prev_bulletin_image
+    else:
+        image = _render_bulletin_frame(epd, fonts, bulletin_items, current_time, current_date,
+                                       scroll_position, selected_item, content_scroll_position)
+        _prev_bulletin_state = state
+        _prev_bulletin_image = image
+    return image
+
+def _render_bulletin_frame(epd, fonts, bulletin_items, current_time, current_date,
+                           scroll_position, selected_item, content_scroll_position):
+    """Draw an upright bulletin frame for draw_bulletin_screen"""
+    font_lg, font_md, font_sm, font_xs = fonts
+    
+    
+    # Header bar, divider and Next button come from the cached chrome
+    image = _new_bulletin_image(epd, fonts)
+    draw = ImageDraw.Draw(image)
     
     # Check if we're in bulletin detail view and have scrolled down
     if selected_item is not None and content_scroll_position > 0:
         # When scrolled down, show a back button in the top bar instead of time
         draw.text((5, 1), "< Back", font=font_sm, fill=255)
-        draw.text((epd.height//2 - 10, 1), "|", font=font_sm, fill=255)
         draw.text((epd.height//2, 1), current_date, font=font_sm, fill=255)
     else:
         # Regular header with time and date
         draw.text((5, 1), current_time, font=font_sm, fill=255)
-        draw.text((epd.height//2 - 10, 1), "|", font=font_sm, fill=255)
         draw.text((epd.height//2, 1), current_date, font=font_sm, fill=255)
     
-    # Make the Next button in the top right
-    draw.rectangle([(270, 0), (295, 15)], outline=0, fill=0)
-    draw.text((273, 1), "Next", font=font_xs, fill=255)
-    
     # Add a bulletin title - but only on the first page (when scroll_position is 0)
     # Smaller title that only appears on first page when no item is selected
     if scroll_position == 0 and selected_item is None:
@@ -764,16 +860,13 @@ def draw_bulletin_screen(epd, fonts, bulletin_items, current_time=None, current_
         
         # Draw visible bulletin items based on scroll position
         if total_items > 0:
-            # Determine actual number of items to fetch for display on this page
-            # This is current_page_layout_capacity, already calculated above
-            
-            visible_items_to_draw = bulletin_items[scroll_position : scroll_position + current_page_layout_capacity]
+            # Only the visible window is touched. Each row takes 34px and must start
+            # at or above y=110, so clamp the window to the rows that fit on screen.
+            rows_that_fit = (110 - y_pos) // 34 + 1
+            start = scroll_position
+            end = min(start + min(current_page_layout_capacity, rows_that_fit), total_items)
             
-            for i, item in enumerate(visible_items_to_draw):
-                # Skip if we're out of space (should not happen with correct y_pos and item heights)
-                if y_pos > 110: # Safety break
-                    break
-                
+            for display_index, item in enumerate(bulletin_items[start:end], start=start + 1):
                 # Item background - make items touchable with slightly smaller dimensions
                 item_rect = [(0, y_pos - 3), (265, y_pos + 22)]
                 draw.rectangle(item_rect, outline=0)
@@ -782,30 +875,12 @@ def draw_bulletin_screen(epd, fonts, bulletin_items, current_time=None, current_
                 draw.rectangle([(255, y_pos), (260, y_pos + 5)], outline=0, fill=0)
                     
                 # Draw headline with index number
-                headline = item["headline"]
-                headline = headline if len(headline) < 35 else headline[:32] + "..."
-                
-                display_index = i + scroll_position + 1  # 1-based item numbering
-                draw.text((5, y_pos), f"{display_index}. {headline}", font=font_xs, fill=0)
+                headline_text = fit_text(f"{display_index}. {item['headline']}", font_xs, LIST_HEADLINE_MAX_PX)
+                draw.text((5, y_pos), headline_text, font=font_xs, fill=0)
                 y_pos += 12  # Reduced space between headline and preview
                 
                 # Draw a short preview of content 
-                content = item["content"]
-                # Replace all newlines with spaces to ensure single line display
-                content_preview = content.strip().replace("\n", " ").replace("\\n", " ")
-                
-                # Remove any multiple spaces that might have been created
-                content_preview = " ".join(content_preview.split())
-                
-                # Limit preview to one line but allow more characters
-                if len(content_preview) > 50:
-                    content_preview = content_preview[:50] + "..."
-                    
-                draw.text((15, y_pos), content_preview, font=font_xs, fill=0)
+                draw.text((15, y_pos), fit_text(_preview_source(item["content"]), font_xs, LIST_PREVIEW_MAX_PX), font=font_xs, fill=0)
                 y_pos += 22  # Slightly reduced space between items with rectangle
     
-    # Apply rotation if needed
-    if config and config.get('display_rotation') == 180:
-        image = image.rotate(180)
-    
     return image
@@ -2,14 +2,74 @@
 # -*- coding:utf-8 -*-
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import json
-from datetime import datetime, timedelta
-from collections import defaultdict
+import re
+import shutil
+import sys
+import time
+from datetime import date, datetime
 from dotenv import load_dotenv
 
+# orjson is optional - it (de)serializes the parsed cache in C, json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
+# How long a downloaded ICS file is trusted before it is revalidated with the server
+CACHE_TTL = 3600  # 1 hour
+
+# Minimum time between the forced re-download/re-parse that get_day_schedule falls back to
+SCHEDULE_REFRESH_COOLDOWN = 300  # 5 minutes
+
+# Handlers for the ICS properties we care about, keyed by the raw tag bytes before the ':'.
+# Each one receives the property value, the per-event state dict and the output lists
+# (class_list, location_list, datetime_list).
+def _on_summary(value, event, lists):
+    lists[0].append(value)
+
+def _on_location(value, event, lists):
+    event['location'] = value
+    lists[1].append(value)
+
+def _on_dtstart(value, event, lists):
+    lists[2].append(value)
+
+def _on_description(value, event, lists):
+    # Some events might have location in description
+    if not event.get('location'):
+        parts = value.split()
+        if parts:
+            event['location'] = parts[-1]
+            lists[1].append(parts[-1])
+
+# Week 1 and Week 2 are swapped in the ICS data, so labels are inverted via these lookups
+_INVERTED_WEEK = (None, 2, 1)
+# Days to add to the reference Monday for each (actual) week's dates
+_WEEK_DAY_OFFSET = (None, 0, 7)
+# Period keys as strings, indexed by period number
+_PERIOD_STR = tuple(str(i) for i in range(6))
+_SCHOOL_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday')
+
+def _parse_ics_date(value):
+    """Return the date part of a fixed-width YYYYMMDDTHHMMSSZ ICS timestamp."""
+    return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+
+_ICS_TAG_HANDLERS = {
+    b"SUMMARY": _on_summary,
+    b"LOCATION": _on_location,
+    b"DTSTART": _on_dtstart,
+    b"DESCRIPTION": _on_description,
+}
+
+# One pass over the raw bytes of an event picks out just the properties above
+_ICS_PROPERTY_RE = re.compile(rb'^(SUMMARY|LOCATION|DTSTART|DESCRIPTION):([^\r\n]*)', re.MULTILINE)
+
 class ICSParser:
     def __init__(self, ics_url, cache_dir=None):
         self.ics_url = ics_url
@@ -22,23 +82,44 @@ class ICSParser:
             
         self.cache_file = os.path.join(self.cache_dir, "timetable.ics")
         self.parsed_cache_file = os.path.join(self.cache_dir, "timetable.json")
+        self.meta_file = os.path.join(self.cache_dir, "timetable.meta.json")
         
         # Make sure cache directory exists
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir, exist_ok=True)
         
-        self.timetable = defaultdict(lambda: defaultdict(list))
-        self.weeks = {1: [], 2: []}
+        # Plain nested dicts (day -> period -> classes) so the cache can be written as-is
+        self.timetable = {}
+        # week -> set of ISO dates; nothing needs them ordered so they stay sets
+        self.weeks = {1: set(), 2: set()}
+        
+        # week -> day -> period -> first class entry, what get_day_schedule shows; built by _index_by_week()
+        self._by_week = {1: {}, 2: {}}
+        # Every period key in the timetable, in numeric order
+        self._periods_sorted = _PERIOD_STR[1:]
         
         # Week 1 Monday reference date (May 19, 2025)
         self.reference_date = datetime(2025, 5, 19)
         self.reference_week = 1
+        self._ref_ordinal = self.reference_date.toordinal()
+        
+        # (date ordinal, week number) of the last get_current_week_number() call
+        self._week_cache = (None, None)
+        
+        # time.monotonic() of the last forced refresh triggered by a missing schedule
+        self._last_refresh_ts = None
+        
+        # mtime of the ICS file the in-memory timetable was parsed from
+        self._parsed_ics_mtime = None
+        
+        # ((date ordinal, show next day), result) of the last get_schedule_for_display() call
+        self._display_cache = (None, None)
         
         # If we're running this on May 17, 2025 (weekend before Week 1)
         # We need to handle this specially since get_current_week_number will be 
         # based on this reference date
-        current_date = datetime.now().date()
-        if current_date < self.reference_date.date():
+        current_date = date.today()
+        if current_date.toordinal() < self._ref_ordinal:
             logging.info(f"Current date {current_date} is before reference date, using Week 1 as current week")
             
         # Define the period times for each day
@@ -80,6 +161,19 @@ class ICSParser:
             }
         }
         
+        # Pre-split the period ranges into (start, end) tuples so lookups don't re-split strings
+        self._period_se = {
+            day: {period: tuple(time_range.split('-')) for period, time_range in periods.items()}
+            for day, periods in self.period_times.items()
+        }
+        
+        # Flat (day, period) -> "HH:MM" start time table for the parse loop
+        self._start_times = {
+            (day, period): start
+            for day, periods in self._period_se.items()
+            for period, (start, _) in periods.items()
+        }
+        
         # Headers for making requests to the school server
         self.headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
@@ -92,24 +186,82 @@ class ICSParser:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:95.0) Gecko/20100101 Firefox/95.0'
         }
         
+        # Reuse one HTTP session so repeated refreshes keep the connection alive,
+        # retrying transient connection failures with a short backoff
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+    def _load_download_meta(self):
+        """Load the ETag/Last-Modified validators saved with the cached ICS file"""
+        try:
+            with open(self.meta_file, 'r') as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return {}
+    
+    def _save_download_meta(self, etag, last_modified):
+        """Save the validators for the cached ICS file along with when they were checked"""
+        try:
+            with open(self.meta_file, 'w') as f:
+                json.dump({'etag': etag, 'last_modified': last_modified, 'checked': time.time()}, f)
+        except IOError as e:
+            logging.error(f"Error saving timetable download metadata: {e}")
+    
     def download_timetable(self, force=False):
-        """Download the ICS file from the URL and save it to cache"""
-        if os.path.exists(self.cache_file) and not force:
-            logging.info("Using cached timetable file")
-            return True
+        """Download the ICS file from the URL and save it to cache
+        
+        A cached file is used as-is until it is CACHE_TTL seconds old. After that, or when
+        force is set, the server is asked with a conditional GET and a 304 response keeps
+        the cached file without transferring it again.
+        """
+        have_cache = os.path.exists(self.cache_file)
+        meta = self._load_download_meta() if have_cache else {}
+        
+        if have_cache and not force:
+            last_checked = meta.get('checked') or os.path.getmtime(self.cache_file)
+            if time.time() - last_checked < CACHE_TTL:
+                logging.info("Using cached timetable file")
+                return True
+        
+        # Only send validators if we have a file they describe
+        conditional_headers = {}
+        if meta.get('etag'):
+            conditional_headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            conditional_headers['If-Modified-Since'] = meta['last_modified']
             
         try:
             logging.info(f"Downloading timetable from {self.ics_url}")
-            response = requests.get(self.ics_url, headers=self.headers, timeout=10)
-            
-            if response.status_code == 200:
-                with open(self.cache_file, 'wb') as f:
-                    f.write(response.content)
-                logging.info("Timetable downloaded successfully")
-                return True
-            else:
-                logging.error(f"Failed to download timetable: HTTP {response.status_code}")
-                return False
+            with self._session.get(self.ics_url, headers=conditional_headers, timeout=10, stream=True) as response:
+                if response.status_code == 304:
+                    logging.info("Timetable not modified on server, keeping cached file")
+                    self._save_download_meta(meta.get('etag'), meta.get('last_modified'))
+                    return True
+                elif response.status_code == 200:
+                    # Let urllib3 undo gzip/deflate while streaming to disk. Stream into a
+                    # temporary file so a dropped connection can't leave a truncated ICS
+                    # in place of the good cached one
+                    response.raw.decode_content = True
+                    tmp_path = self.cache_file + '.tmp'
+                    try:
+                        with open(tmp_path, 'wb') as f:
+                            shutil.copyfileobj(response.raw, f, length=65536)
+                        os.replace(tmp_path, self.cache_file)
+                    except BaseException:
+                        try:
+                            os.remove(tmp_path)
+                        except OSError:
+                            pass
+                        raise
+                    self._save_download_meta(response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                    logging.info("Timetable downloaded successfully")
+                    return True
+                else:
+                    logging.error(f"Failed to download timetable: HTTP {response.status_code}")
+                    return False
                 
         except Exception as e:
             logging.error(f"Error downloading timetable: {e}")
@@ -118,30 +270,29 @@ class ICSParser:
     def parse_timetable(self, force=False):
         """Parse the cached ICS file into a structured timetable using direct parsing approach"""
         
-        # Custom JSON encoder to handle date objects
-        class DateTimeEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                elif hasattr(obj, 'isoformat'):
-                    return obj.isoformat()
-                return super(DateTimeEncoder, self).default(obj)
-        
-        # Check if we have already parsed the timetable
-        if os.path.exists(self.parsed_cache_file) and not force:
+        ics_mtime = os.path.getmtime(self.cache_file) if os.path.exists(self.cache_file) else None
+        
+        # Nothing to do if this same ICS file is already parsed in memory
+        if not force and ics_mtime is not None and ics_mtime == self._parsed_ics_mtime:
+            logging.info("Timetable already parsed from the current ICS file")
+            return True
+        
+        # Check if we have already parsed the timetable, and that the parse is newer than the ICS file
+        parsed_cache_fresh = (os.path.exists(self.parsed_cache_file) and
+                              (ics_mtime is None or os.path.getmtime(self.parsed_cache_file) >= ics_mtime))
+        if parsed_cache_fresh and not force:
             try:
-                with open(self.parsed_cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    self.timetable = defaultdict(lambda: defaultdict(list))
-                    
-                    # Convert the JSON back to our structure
-                    for day_key, periods in cache_data['timetable'].items():
-                        for period_key, classes in periods.items():
-                            self.timetable[day_key][period_key] = classes
-                    
-                    self.weeks = cache_data['weeks']
-                    logging.info("Loaded parsed timetable from cache")
-                    return True
+                with open(self.parsed_cache_file, 'rb') as f:
+                    raw = f.read()
+                cache_data = orjson.loads(raw) if orjson else json.loads(raw)
+                # The JSON already has our day -> period -> classes shape, use it as-is
+                self.timetable = cache_data['timetable']
+                # JSON stores the week keys as strings and the date sets as lists
+                self.weeks = {int(week): set(dates) for week, dates in cache_data['weeks'].items()}
+                self._index_by_week()
+                self._parsed_ics_mtime = ics_mtime
+                logging.info("Loaded parsed timetable from cache")
+                return True
             except Exception as e:
                 logging.error(f"Error loading parsed timetable: {e}")
                 # Continue to parse the original file
@@ -151,43 +302,30 @@ class ICSParser:
             success = self.download_timetable(force=True)
             if not success:
                 return False
+        ics_mtime = os.path.getmtime(self.cache_file)
         
         # Clear existing timetable and weeks data
-        self.timetable = defaultdict(lambda: defaultdict(list))
+        # Every (day, period) slot exists up front, so the parse loop appends directly
+        self.timetable = {day: {period: [] for period in _PERIOD_STR[1:]} for day in _SCHOOL_DAYS}
         self.weeks = {1: set(), 2: set()}
         
         try:
             # Parse the ICS file directly using a similar approach to timetableScraper.py
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                raw_ics = f.read().split("BEGIN:VEVENT")
+            with open(self.cache_file, 'rb') as f:
+                raw_ics = f.read().split(b"BEGIN:VEVENT")
             
             class_list = []
             location_list = []
             datetime_list = []
+            lists = (class_list, location_list, datetime_list)
             
             # Extract class names, locations, and dates from the ICS file
             for event in raw_ics:
-                class_name = None
-                location = None
-                dt_start = None
+                event_state = {}
                 
-                for line in event.split('\n'):
-                    if line.startswith("SUMMARY:"):
-                        class_name = line[8:]
-                        class_list.append(class_name)
-                    elif line.startswith("LOCATION:"):
-                        location = line[9:]
-                        location_list.append(location)
-                    elif line.startswith("DTSTART:"):
-                        dt_start = line[8:]
-                        datetime_list.append(dt_start)
-                    elif line.startswith("DESCRIPTION:") and not location:
-                        # Some events might have location in description
-                        description = line[12:]
-                        parts = description.split()
-                        if parts:
-                            location = parts[-1]
-                            location_list.append(location)
+                for match in _ICS_PROPERTY_RE.finditer(event):
+                    tag, value = match.groups()
+                    _ICS_TAG_HANDLERS[tag](value.decode('utf-8'), event_state, lists)
             
             # If we have any classes, let's process them
             if len(class_list) > 0:
@@ -204,11 +342,11 @@ class ICSParser:
                     try:
                         # Parse the first date
                         first_date_str = datetime_list[0]
-                        # Format: YYYYMMDDTHHMMSSZ
-                        first_date = datetime.strptime(first_date_str, "%Y%m%dT%H%M%SZ")
+                        # Format: YYYYMMDDTHHMMSSZ - only the date part matters here
+                        first_date = _parse_ics_date(first_date_str)
                         
                         # Calculate the week number for the first event
-                        days_diff = (first_date.date() - self.reference_date.date()).days
+                        days_diff = first_date.toordinal() - self._ref_ordinal
                         weeks_diff = days_diff // 7
                         first_event_week = (self.reference_week + weeks_diff) % 2
                         if first_event_week == 0:
@@ -221,22 +359,29 @@ class ICSParser:
                         logging.warning(f"Couldn't parse first date, using default offset: {e}")
                 
                 # Days of the week
-                days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+                days = _SCHOOL_DAYS
                 
                 # Process data for each week
                 for week in range(1, 3):
+                    # Swap weeks 1 and 2 for correct data alignment (1 -> 2 and 2 -> 1)
+                    adjusted_week = _INVERTED_WEEK[week]
+                    
+                    # Invert weeks: Fix for issue where Week 1 and Week 2 data were swapped
+                    # The data from the ICS file doesn't align with actual Week 1/Week 2 
+                    # (e.g., What should be Week 1 is labeled as Week 2 in the data)
+                    actual_week = _INVERTED_WEEK[week]
+                    
                     for day_idx in range(5):  # 5 days
                         day_name = days[day_idx]
                         
                         for period in range(1, 6):  # 5 periods
+                            period_str = _PERIOD_STR[period]
+                            
                             # Calculate index in the class_list and location_list
                             # Adjust the index calculation to fix the off-by-one day issue and swap Week 1/Week 2
                             # We need to shift the day_idx by -1 (with wrapping) to get correct day alignment
                             adjusted_day_idx = (day_idx - 1) % 5
                             
-                            # Swap weeks 1 and 2 for correct data alignment
-                            adjusted_week = 3 - week  # This swaps 1 -> 2 and 2 -> 1
-                            
                             # Original idx calculation:
                             # idx = offset + ((adjusted_week - 1) * events_per_week) + (adjusted_day_idx * 5) + (period - 1)
 
@@ -273,53 +418,44 @@ class ICSParser:
                                     location = 'PE'
                                 
                                 # Get the time for this period
-                                time_str = self.period_times[day_name][str(period)].split('-')[0]
+                                time_str = self._start_times[(day_name, period_str)]
                                 
                                 # Format the class display
                                 class_display = f"{class_name} in {location}"
                                 
-                                # Add to timetable - use the proper week number (from our loop, not adjusted)
-                                # Invert weeks: Fix for issue where Week 1 and Week 2 data were swapped
-                                # The data from the ICS file doesn't align with actual Week 1/Week 2 
-                                # (e.g., What should be Week 1 is labeled as Week 2 in the data)
-                                actual_week = 3 - week  # This inverts the week (1 becomes 2, 2 becomes 1)
-                                self.timetable[day_name][str(period)].append({
+                                # Add to timetable under the inverted week worked out above
+                                self.timetable[day_name][period_str].append({
                                     'class': class_display,
                                     'time': time_str,
                                     'week': actual_week,  # Use the inverted week
                                     'description': f"{class_name} {location}"
                                 })
                                 
-                                # Store dates for weeks (use reference date + days offset)
-                                base_date = self.reference_date
-                                day_offset = days.index(day_name)
-                                
-                                # Store the date in the inverted week's list
-                                if actual_week == 1:
-                                    week_date = base_date + timedelta(days=day_offset)
-                                else:  # actual_week 2
-                                    week_date = base_date + timedelta(days=day_offset + 7)
-                                    
-                                self.weeks[actual_week].add(week_date.date().isoformat())
+                                # Store the date in the inverted week's list (reference date + days offset)
+                                week_ordinal = self._ref_ordinal + day_idx + _WEEK_DAY_OFFSET[actual_week]
+                                self.weeks[actual_week].add(date.fromordinal(week_ordinal).isoformat())
                 
+                self._index_by_week()
                 logging.info(f"Successfully parsed {len(class_list)} classes from ICS file")
             else:
                 logging.error("No classes found in the ICS file")
                 return False
             
-            # Convert sets to lists for JSON serialization
-            for week in self.weeks:
-                self.weeks[week] = sorted(list(self.weeks[week]))
-            
-            # Save the parsed data to cache
+            # Save the parsed data to cache, with the week date sets written as plain lists
             cache_data = {
-                'timetable': {k: dict(v) for k, v in self.timetable.items()},
-                'weeks': self.weeks
+                'timetable': self.timetable,
+                'weeks': {week: list(dates) for week, dates in self.weeks.items()}
             }
             
-            with open(self.parsed_cache_file, 'w') as f:
-                json.dump(cache_data, f, cls=DateTimeEncoder)
+            # Everything in the cache is already plain str/int/list/dict, so no custom encoder
+            if orjson:
+                raw = orjson.dumps(cache_data, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                raw = json.dumps(cache_data).encode('utf-8')
+            with open(self.parsed_cache_file, 'wb') as f:
+                f.write(raw)
                 
+            self._parsed_ics_mtime = ics_mtime
             logging.info("Timetable parsed and cached successfully")
             return True
                 
@@ -327,29 +463,53 @@ class ICSParser:
             logging.error(f"Error parsing timetable: {e}")
             return False
     
-    def get_current_week_number(self):
-        """Determine the current week number (1 or 2) based on the reference date"""
-        today = datetime.now().date()
+    def _index_by_week(self):
+        """Index the parsed timetable by week, day and period for direct lookups.
+        
+        Entries are shared with self.timetable rather than copied, and only the first
+        class for each (week, day, period) is kept, matching what get_day_schedule shows.
+        """
+        self._by_week = {1: {}, 2: {}}
+        self._display_cache = (None, None)
+        # Period keys are strings, so sort numerically rather than lexicographically
+        self._periods_sorted = tuple(sorted({p for periods in self.timetable.values() for p in periods}, key=int))
+        for day_name, periods in self.timetable.items():
+            for period, classes in periods.items():
+                for c in classes:
+                    self._by_week.setdefault(c['week'], {}).setdefault(day_name, {}).setdefault(period, c)
+    
+    def _week_for_ordinal(self, ordinal):
+        """Week number (1 or 2) for a date given as a proleptic Gregorian ordinal"""
+        days_from_reference = ordinal - self._ref_ordinal
+        
+        # Dates before the reference Monday are treated as Week 1
+        if days_from_reference < 0:
+            return 1
+        
+        # The week number alternates between 1 and 2 every 7 days
+        return (days_from_reference // 7 + self.reference_week - 1) % 2 + 1
+    
+    def get_current_week_number(self, now=None):
+        """Determine the current week number (1 or 2) based on the reference date
+        
+        Args:
+            now: Optional datetime to use instead of reading the clock again
+        """
+        today_ordinal = (now or date.today()).toordinal()
+        
+        # The answer only changes at midnight, so reuse it for the rest of the day
+        if self._week_cache[0] == today_ordinal:
+            return self._week_cache[1]
         
         # If we're before the reference date, handle this special case
-        if today < self.reference_date.date():
+        if today_ordinal < self._ref_ordinal:
             # Since we know the reference date (May 19, 2025) is Week 1 Monday,
             # and the current date is May 17, 2025 (weekend before),
             # we'll return Week 1
-            logging.info(f"Current date {today} is before reference date, using Week 1")
-            return 1
-            
-        # Calculate days from reference date
-        days_from_reference = (today - self.reference_date.date()).days
-        
-        # Calculate how many weeks have passed since the reference date
-        weeks_passed = days_from_reference // 7
+            logging.info(f"Current date {date.fromordinal(today_ordinal)} is before reference date, using Week 1")
         
-        # The current week number alternates between 1 and 2
-        current_week = (self.reference_week + weeks_passed) % 2
-        if current_week == 0:
-            current_week = 2
-            
+        current_week = self._week_for_ordinal(today_ordinal)
+        self._week_cache = (today_ordinal, current_week)
         return current_week
     
     def clear_cache(self):
@@ -364,38 +524,35 @@ class ICSParser:
                 os.remove(self.parsed_cache_file)
                 logging.info(f"Removed parsed cache file: {self.parsed_cache_file}")
                 
+            if os.path.exists(self.meta_file):
+                os.remove(self.meta_file)
+                logging.info(f"Removed download metadata file: {self.meta_file}")
+                
             return True
         except Exception as e:
             logging.error(f"Error clearing cache: {e}")
             return False
     
-    def get_day_schedule(self, day_name, week_number=None):
+    def get_day_schedule(self, day_name, week_number=None, now=None):
         """Get the schedule for a specific day and week"""
         if week_number is None:
-            week_number = self.get_current_week_number()
+            week_number = self.get_current_week_number(now)
             
         logging.info(f"Getting schedule for {day_name}, Week {week_number}")
         day_schedule = {}
         found_any_classes = False
         
         # Log all available classes for this day for debugging
-        for period, classes in self.timetable[day_name].items():
-            for c in classes:
-                logging.debug(f"Available class: Period {period}: {c['class']} (Week {c['week']})")
-        
-        # Get all periods for the specified day
-        for period, classes in self.timetable[day_name].items():
-            # Filter classes for the current week and only take the first one
-            # (we should only have one unique class per period per week)
-            filtered_classes = [c for c in classes if c['week'] == week_number]
-            
-            if filtered_classes:
-                # Take only the first class for each period - we eliminated duplicates during parsing
-                day_schedule[period] = [filtered_classes[0]]
-                logging.info(f"Found class for Period {period}: {filtered_classes[0]['class']} (Week {filtered_classes[0]['week']})")
-                found_any_classes = True
-            else:
-                logging.warning(f"Period {period}: No class found for Week {week_number}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for period, classes in self.timetable.get(day_name, {}).items():
+                for c in classes:
+                    logging.debug(f"Available class: Period {period}: {c['class']} (Week {c['week']})")
+        
+        # Get all periods for the specified day - the index holds one class per period per week
+        for period, entry in self._by_week.get(week_number, {}).get(day_name, {}).items():
+            day_schedule[period] = [entry]
+            logging.debug("Found class for Period %s: %s (Week %s)", period, entry['class'], entry['week'])
+            found_any_classes = True
         
         # Check if we found any classes for this day/week
         if not found_any_classes:
@@ -404,23 +561,25 @@ class ICSParser:
             # Check if we have classes for the other week as a fallback
             other_week = 1 if week_number == 2 else 2
             logging.warning(f"Looking for classes for Week {other_week} as fallback...")
-            for period, classes in self.timetable[day_name].items():
-                filtered_classes = [c for c in classes if c['week'] == other_week]
-                if filtered_classes:
-                    logging.warning(f"Found classes for {day_name}, Week {other_week} instead!")
-                    # Add the classes for the other week with a warning indicator
-                    day_schedule[period] = [filtered_classes[0]]
+            for period, entry in self._by_week.get(other_week, {}).get(day_name, {}).items():
+                logging.warning(f"Found classes for {day_name}, Week {other_week} instead!")
+                # Add the classes for the other week with a warning indicator
+                day_schedule[period] = [entry]
             
-            # If we still have no classes, try forcing a refresh of the timetable data
-            if not day_schedule:
+            # If we still have no classes, try forcing a refresh of the timetable data -
+            # but not on every render if the data genuinely has nothing for this day
+            refresh_due = (self._last_refresh_ts is None or
+                           time.monotonic() - self._last_refresh_ts > SCHEDULE_REFRESH_COOLDOWN)
+            if not day_schedule and refresh_due:
                 logging.warning(f"Attempting to refresh timetable data for {day_name}, Week {week_number}")
+                self._last_refresh_ts = time.monotonic()
                 self.download_timetable(force=True)
                 self.parse_timetable(force=True)
                 # Try once more after refresh
-                for period, classes in self.timetable[day_name].items():
-                    filtered_classes = [c for c in classes if c['week'] == week_number]
-                    if filtered_classes:
-                        day_schedule[period] = [filtered_classes[0]]
+                for period, entry in self._by_week.get(week_number, {}).get(day_name, {}).items():
+                    day_schedule[period] = [entry]
+            elif not day_schedule:
+                logging.info(f"Skipping timetable refresh for {day_name}, last attempt was under {SCHEDULE_REFRESH_COOLDOWN}s ago")
         
         # Verify the week numbers in the returned schedule match the requested week
         for period, classes in day_schedule.items():
@@ -432,34 +591,26 @@ class ICSParser:
                 
         return day_schedule
     
-    def get_current_day_schedule(self):
-        """Get the schedule for the current day"""
-        today = datetime.now()
+    def get_current_day_schedule(self, now=None):
+        """Get the schedule for the current day
+        
+        Args:
+            now: Optional datetime to use instead of reading the clock again
+        """
+        today = now or datetime.now()
         day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         day_name = day_names[today.weekday()]
         
-        week_number = self.get_current_week_number()
+        week_number = self.get_current_week_number(today)
         
         # Check if it's a weekend (5=Saturday, 6=Sunday)
         if today.weekday() >= 5:
             # For weekends, we'll show the next Monday's schedule
             next_monday_name = "Monday"
             
-            # Calculate the week number for next Monday
+            # Calculate the week number for next Monday (Week 1 if it's before our reference date)
             days_until_monday = (7 - today.weekday()) % 7  # Days until next Monday
-            next_monday_date = today.date() + timedelta(days=days_until_monday)
-            
-            # Calculate week number for next Monday
-            if next_monday_date < self.reference_date.date():
-                # If next Monday is before our reference date, use Week 1
-                next_week_number = 1
-            else:
-                # Calculate based on days from reference
-                days_from_reference = (next_monday_date - self.reference_date.date()).days
-                weeks_passed = days_from_reference // 7
-                next_week_number = (self.reference_week + weeks_passed) % 2
-                if next_week_number == 0:
-                    next_week_number = 2
+            next_week_number = self._week_for_ordinal(today.toordinal() + days_until_monday)
             
             # Get the next Monday's schedule
             next_monday_schedule = self.get_day_schedule(next_monday_name, next_week_number)
@@ -482,16 +633,17 @@ class ICSParser:
             "schedule": schedule
         }
         
-        # Add validation to check week numbers match what we expect
-        logging.info("CURRENT DAY SCHEDULE VALIDATION START ---------------")
-        logging.info(f"Expected week number: {week_number}")
-        for period, classes in schedule.items():
-            if classes:
-                if classes[0]['week'] != week_number:
-                    logging.warning(f"⚠️ Week mismatch in period {period}: Expected {week_number}, got {classes[0]['week']}")
-                else:
-                    logging.info(f"✓ Period {period}: {classes[0]['class']} (Week: {classes[0]['week']})")
-        logging.info("CURRENT DAY SCHEDULE VALIDATION END -----------------")
+        # Add validation to check week numbers match what we expect (debug only, runs every render)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("CURRENT DAY SCHEDULE VALIDATION START ---------------")
+            logging.debug(f"Expected week number: {week_number}")
+            for period, classes in schedule.items():
+                if classes:
+                    if classes[0]['week'] != week_number:
+                        logging.warning(f"⚠️ Week mismatch in period {period}: Expected {week_number}, got {classes[0]['week']}")
+                    else:
+                        logging.debug(f"✓ Period {period}: {classes[0]['class']} (Week: {classes[0]['week']})")
+            logging.debug("CURRENT DAY SCHEDULE VALIDATION END -----------------")
         
         return result
         
@@ -505,7 +657,7 @@ class ICSParser:
         Returns:
             A dictionary with timetable data for display
         """
-        # Get current time and day
+        # Get current time and day - read the clock once and pass it down
         current_datetime = datetime.now()
         day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         current_day_name = day_names[current_datetime.weekday()]
@@ -523,31 +675,37 @@ class ICSParser:
             elif current_day_name != "Monday" and (current_hour > 15 or (current_hour == 15 and current_minute >= 20)):
                 # After 3:20 PM on other weekdays
                 show_next_day = True
-                
+        
+        # The result only changes when the date rolls over, the show-next-day cutoff
+        # passes, or the timetable is reparsed (which clears the cache)
+        cache_key = (current_datetime.toordinal(), show_next_day)
+        if self._display_cache[0] == cache_key:
+            return self._display_cache[1]
+        
+        result = self._build_schedule_for_display(current_datetime, day_names, current_day_name, show_next_day)
+        self._display_cache = (cache_key, result)
+        return result
+    
+    def _build_schedule_for_display(self, current_datetime, day_names, current_day_name, show_next_day):
+        """Build the get_schedule_for_display result for an already-resolved time and cutoff"""
         # First, get the current day's schedule
-        current_schedule = self.get_current_day_schedule()
+        current_schedule = self.get_current_day_schedule(current_datetime)
         
         # If we should show the next day's schedule and it's not already the weekend
         if show_next_day and not current_schedule.get("is_weekend", False):
             # Calculate next day
-            next_day_datetime = current_datetime + timedelta(days=1)
-            next_day_idx = next_day_datetime.weekday()
+            next_day_idx = (current_datetime.weekday() + 1) % 7
             
             # If next day is weekend (Saturday or Sunday), show Monday
             if next_day_idx >= 5:  # It's a weekend
                 # Use the weekend logic which will show next Monday's schedule
-                return self.get_current_day_schedule()
+                return self.get_current_day_schedule(current_datetime)
             else:
                 # Get next day's name
                 next_day_name = day_names[next_day_idx]
                 
-                # Calculate week number for the next day based on the reference date
-                # This ensures consistent week calculation based on the actual date
-                # rather than special-casing certain day transitions
-                next_day_date = current_datetime.date() + timedelta(days=1)
-                
                 # Get current week number to check if we're staying in the same week
-                current_week_number = self.get_current_week_number()
+                current_week_number = self.get_current_week_number(current_datetime)
                 
                 # For all day transitions within a work week (Monday through Friday),
                 # we should stay in the same week number. Only when transitioning to a new
@@ -561,28 +719,20 @@ class ICSParser:
                 else:
                     # For week transitions (Friday -> Saturday, Saturday -> Sunday, Sunday -> Monday),
                     # calculate using the reference date
-                    days_from_reference = (next_day_date - self.reference_date.date()).days
-                    
-                    # Calculate how many weeks have passed since the reference date
-                    weeks_passed = days_from_reference // 7
-                    
-                    # The week number alternates between 1 and 2
-                    next_week_number = (self.reference_week + weeks_passed) % 2
-                    if next_week_number == 0:
-                        next_week_number = 2
+                    next_week_number = self._week_for_ordinal(current_datetime.toordinal() + 1)
                     logging.info(f"Calculated new week {next_week_number} when moving from {current_day_name} to {next_day_name}")
                     
                 # Get the schedule for the next day
                 next_day_schedule = self.get_day_schedule(next_day_name, next_week_number)
                 
                 # Log the schedule details for debugging
-                logging.info(f"Next day schedule - Day: {next_day_name}, Week: {next_week_number}")
+                logging.debug("Next day schedule - Day: %s, Week: %s", next_day_name, next_week_number)
                 for period, classes in next_day_schedule.items():
                     if classes:
                         # Check if the class's actual week matches the requested week
                         if classes[0]['week'] != next_week_number:
                             logging.warning(f"Period {period}: Class week mismatch! Requested Week {next_week_number}, got {classes[0]['week']}")
-                        logging.info(f"Period {period}: {classes[0]['class']} (Week {classes[0]['week']})")
+                        logging.debug("Period %s: %s (Week %s)", period, classes[0]['class'], classes[0]['week'])
                 
                 # Construct the result similar to get_current_day_schedule output
                 result = {
@@ -594,104 +744,109 @@ class ICSParser:
                 }
                 
                 # Add additional validation at the end to ensure week numbers match what we expect
-                logging.info("SCHEDULE VALIDATION START ---------------")
-                logging.info(f"Expected week number: {next_week_number}")
+                logging.debug("SCHEDULE VALIDATION START ---------------")
+                logging.debug("Expected week number: %s", next_week_number)
                 for period, classes in next_day_schedule.items():
                     if classes:
                         if classes[0]['week'] != next_week_number:
                             logging.warning(f"⚠️ Week mismatch in period {period}: Expected {next_week_number}, got {classes[0]['week']}")
                         else:
-                            logging.info(f"✓ Period {period}: {classes[0]['class']} (Week: {classes[0]['week']})")
-                logging.info("SCHEDULE VALIDATION END -----------------")
+                            logging.debug("✓ Period %s: %s (Week: %s)", period, classes[0]['class'], classes[0]['week'])
+                logging.debug("SCHEDULE VALIDATION END -----------------")
                 
                 return result
         
-        # Final sanity check - let's directly check what week flags the classes have
-        logging.info("🔍 DIRECT CLASS DATA VERIFICATION 🔍")
-        weekday = datetime.now().weekday()
-        if weekday < 5:  # Only for weekdays (0-4)
+        # Final sanity check - let's directly check what week flags the classes have (debug only)
+        weekday = current_datetime.weekday()
+        if weekday < 5 and logging.getLogger().isEnabledFor(logging.DEBUG):  # Only for weekdays (0-4)
+            logging.debug("🔍 DIRECT CLASS DATA VERIFICATION 🔍")
             day_name = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"][weekday]
-            logging.info(f"Checking raw data for {day_name}:")
-            for period, classes in self.timetable[day_name].items():
+            logging.debug("Checking raw data for %s:", day_name)
+            for period, classes in self.timetable.get(day_name, {}).items():
                 for class_info in classes:
-                    logging.info(f"  Period {period}: {class_info['class']} (Week: {class_info['week']})")
+                    logging.debug("  Period %s: %s (Week: %s)", period, class_info['class'], class_info['week'])
         
         # Default: return current day's schedule
         return current_schedule
 
 def print_full_timetable(parser):
     """Print the full timetable for both weeks"""
-    print("\n===== COMPLETE TIMETABLE =====")
+    # Collect the lines and write them in one go rather than print() per line
+    out = ["\n===== COMPLETE TIMETABLE =====\n"]
     
     days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
     weeks = [1, 2]
     
-    current_week = parser.get_current_week_number()
-    print(f"Current week: {current_week}")
-    print(f"Reference date: {parser.reference_date.strftime('%A, %B %d, %Y')} (Week {parser.reference_week})")
     today = datetime.now()
-    print(f"Today's date: {today.strftime('%A, %B %d, %Y')}")
-    days_from_reference = (today.date() - parser.reference_date.date()).days
-    print(f"Days from reference: {days_from_reference}")
+    current_week = parser.get_current_week_number(today)
+    out.append(f"Current week: {current_week}\n")
+    out.append(f"Reference date: {parser.reference_date.strftime('%A, %B %d, %Y')} (Week {parser.reference_week})\n")
+    out.append(f"Today's date: {today.strftime('%A, %B %d, %Y')}\n")
+    days_from_reference = today.toordinal() - parser._ref_ordinal
+    out.append(f"Days from reference: {days_from_reference}\n")
     weeks_passed = days_from_reference // 7
-    print(f"Weeks passed: {weeks_passed}")
+    out.append(f"Weeks passed: {weeks_passed}\n")
     calc_week = (parser.reference_week + weeks_passed) % 2
     if calc_week == 0:
         calc_week = 2
-    print(f"Calculated week: {calc_week}")
+    out.append(f"Calculated week: {calc_week}\n")
     
     for week_number in weeks:
-        print(f"\n--- WEEK {week_number} ---")
+        out.append(f"\n--- WEEK {week_number} ---\n")
         
         for day_name in days:
-            print(f"\n{day_name}:")
+            out.append(f"\n{day_name}:\n")
             
             schedule = parser.get_day_schedule(day_name, week_number)
-            periods = sorted(schedule.keys())
             
-            if not periods:
-                print("  No classes scheduled")
+            if not schedule:
+                out.append("  No classes scheduled\n")
                 continue
-                
-            for period in periods:
-                for class_info in schedule[period]:
-                    time_range = parser.period_times[day_name][period]
-                    print(f"  Period {period} ({time_range}): {class_info['class']} (Week flag: {class_info['week']})")
+            
+            period_times_day = parser.period_times[day_name]
+            for period in parser._periods_sorted:
+                classes = schedule.get(period)
+                if not classes:
+                    continue
+                time_range = period_times_day[period]
+                for class_info in classes:
+                    out.append(f"  Period {period} ({time_range}): {class_info['class']} (Week flag: {class_info['week']})\n")
     
-    print("\n=============================")
+    out.append("\n=============================\n")
+    sys.stdout.write("".join(out))
 
 # Add a utility function to debug week numbering and class filtering
 def debug_timetable_data(parser):
-    print("\n===== DEBUGGING TIMETABLE DATA =====")
+    out = ["\n===== DEBUGGING TIMETABLE DATA =====\n"]
     today = datetime.now()
-    current_week = parser.get_current_week_number()
+    current_week = parser.get_current_week_number(today)
     
     # Print key timetable data
-    print(f"Today's date: {today.strftime('%A, %B %d, %Y')}")
-    print(f"Reference date: {parser.reference_date.strftime('%A, %B %d, %Y')} (Week {parser.reference_week})")
-    print(f"Current calculated week: {current_week}")
+    out.append(f"Today's date: {today.strftime('%A, %B %d, %Y')}\n")
+    out.append(f"Reference date: {parser.reference_date.strftime('%A, %B %d, %Y')} (Week {parser.reference_week})\n")
+    out.append(f"Current calculated week: {current_week}\n")
     
     # Print raw class data for today's day
     day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
     day_name = day_names[today.weekday()]
     
-    print(f"\nRaw class data for {day_name}:")
-    for period, classes in parser.timetable[day_name].items():
+    # One pass over the day's classes fills the raw listing and both week listings
+    out.append(f"\nRaw class data for {day_name}:\n")
+    week_out = {1: [], 2: []}
+    for period, classes in parser.timetable.get(day_name, {}).items():
         for class_info in classes:
-            print(f"  Period {period}: {class_info['class']} (Week: {class_info['week']})")
+            line = f"  Period {period}: {class_info['class']} (Week: {class_info['week']})\n"
+            out.append(line)
+            if class_info['week'] in week_out:
+                week_out[class_info['week']].append(line)
     
     # Print filtered classes for both weeks
     for week in [1, 2]:
-        print(f"\nFiltered classes for {day_name}, Week {week}:")
-        day_schedule = {}
-        for period, classes in parser.timetable[day_name].items():
-            filtered_classes = [c for c in classes if c['week'] == week]
-            if filtered_classes:
-                day_schedule[period] = filtered_classes
-                for class_info in filtered_classes:
-                    print(f"  Period {period}: {class_info['class']} (Week: {class_info['week']})")
+        out.append(f"\nFiltered classes for {day_name}, Week {week}:\n")
+        out.extend(week_out[week])
     
-    print("\n=============================")
+    out.append("\n=============================\n")
+    sys.stdout.write("".join(out))
 
 # Main execution function
 def main():
@@ -716,7 +871,7 @@ def main():
         if parse_success:
             # Print today's date and current week number
             today = datetime.now()
-            current_week = parser.get_current_week_number()
+            current_week = parser.get_current_week_number(today)
             print(f"\nToday is {today.strftime('%A, %B %d, %Y')} (Week {current_week})")
             
             # Get and print current day schedule
@@ -726,12 +881,16 @@ def main():
             if schedule.get('is_weekend', False):
                 print(f"Today is {schedule['day']} (Weekend)")
                 print(f"Next Monday (Week {schedule['next_week']}):")
-                for period, classes in sorted(schedule['next_schedule'].items()):
+                next_schedule = schedule['next_schedule']
+                for period in parser._periods_sorted:
+                    classes = next_schedule.get(period)
                     if classes:
                         time_range = parser.period_times["Monday"][period]
                         print(f"  Period {period} ({time_range}): {classes[0]['class']}")
             else:
-                for period, classes in sorted(schedule['schedule'].items()):
+                day_schedule = schedule['schedule']
+                for period in parser._periods_sorted:
+                    classes = day_schedule.get(period)
                     if classes:
                         time_range = parser.period_times[schedule['day']][period]
                         print(f"  Period {period} ({time_range}): {classes[0]['class']}")
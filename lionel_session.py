@@ -5,16 +5,25 @@ import sys
 import time
 import json
 import logging
+import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional - it reads and writes the session file in C, json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Directory of this script, resolved once for the .env, session and debug file paths
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 
 # Try to import dotenv for loading environment variables
 try:
     from dotenv import load_dotenv
-    # Get the directory of the current script
-    script_dir = os.path.dirname(os.path.realpath(__file__))
     # Load environment variables from .env file in the script directory
-    env_path = os.path.join(script_dir, '.env')
+    env_path = os.path.join(SCRIPT_DIR, '.env')
     if os.path.exists(env_path):
         load_dotenv(env_path)
         logging.info(f"Loaded environment from: {env_path}")
@@ -55,8 +64,57 @@ Note: The session token is cached to a local file and reused until it expires.
 # Constants
 LIONEL_BASE_URL = "https://lionel2.kgv.edu.hk"
 LOGIN_URL = f"{LIONEL_BASE_URL}/login/index.php"
-SESSION_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'session.json')
+SESSION_FILE = os.path.join(SCRIPT_DIR, 'session.json')
+DEBUG_HTML_FILE = os.path.join(SCRIPT_DIR, 'login_page_debug.html')
 SESSION_TIMEOUT = 3 * 60 * 60  # 3 hours in seconds
+VALIDATION_TTL = 5 * 60  # Trust a successful session probe for 5 minutes
+
+# (session timestamp, time it was last confirmed valid) for the in-process probe cache
+_last_validated = (None, 0.0)
+
+# (session file mtime, parsed session data) so the file is only re-read when it changes
+_session_cache = (None, None)
+
+# Shared connection pool so the session probe and logins reuse pooled connections.
+# Each request sequence gets its own Session (and so its own cookie jar) on top of it
+_http_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                            max_retries=Retry(total=2, backoff_factor=0.2))
+
+def _new_http_session():
+    """A requests.Session with an empty cookie jar that uses the shared connection pool.
+
+    Don't close() it: that would close the shared adapter too.
+    """
+    session = requests.Session()
+    session.mount('https://', _http_adapter)
+    return session
+
+# Precompiled byte patterns for the few things we look for in Lionel's HTML,
+# so pages are scanned once instead of being parsed into a full tree
+LOGINTOKEN_INPUT_RE = re.compile(rb'<input\b[^>]*\bname=["\']logintoken["\'][^>]*>', re.IGNORECASE)
+INPUT_VALUE_RE = re.compile(rb'\bvalue=["\']([^"\']*)["\']', re.IGNORECASE)
+SESSKEY_RE = re.compile(rb'sesskey":"([^"]+)"')
+LOGIN_ERRORS_RE = re.compile(rb'<div\b[^>]*\bclass=["\'][^"\']*\bloginerrors\b', re.IGNORECASE)
+LOGOUT_LINK_RE = re.compile(rb'<a\b[^>]*>\s*Log ?out\s*</a>')
+
+def _find_login_token(content):
+    """Return the value of the logintoken input in a page, or None"""
+    token_input = LOGINTOKEN_INPUT_RE.search(content)
+    if token_input:
+        value = INPUT_VALUE_RE.search(token_input.group(0))
+        if value:
+            return value.group(1).decode('utf-8', 'replace')
+    return None
+
+def _has_user_markers(content, username):
+    """Check a page for the signed-in username in the page text or a Logout link.
+
+    The username only counts outside a tag: a failed login echoes it back in the
+    username input's value attribute.
+    """
+    if username and re.search(rb'>[^<]*' + re.escape(username.encode('utf-8')), content):
+        return True
+    return LOGOUT_LINK_RE.search(content) is not None
 
 def get_session_token(username=None, password=None):
     """Get a valid session token for the Lionel website
@@ -99,24 +157,45 @@ def get_session_token(username=None, password=None):
 
 def load_session():
     """Load session data from file if it exists"""
+    global _session_cache
     try:
         if os.path.exists(SESSION_FILE):
-            with open(SESSION_FILE, 'r') as f:
-                return json.load(f)
+            mtime = os.path.getmtime(SESSION_FILE)
+            if _session_cache[0] == mtime:
+                return _session_cache[1]
+            with open(SESSION_FILE, 'rb') as f:
+                raw = f.read()
+            session_data = orjson.loads(raw) if orjson else json.loads(raw)
+            _session_cache = (mtime, session_data)
+            return session_data
     except Exception as e:
         logging.error(f"Error loading session file: {e}")
     
     return None
 
 def save_session(session_data):
-    """Save session data to file"""
+    """Save session data to file
+    
+    Writes to a temporary file and renames it into place, so a crash mid-write
+    can't leave a corrupt session file behind.
+    """
+    global _session_cache
     try:
-        with open(SESSION_FILE, 'w') as f:
-            json.dump(session_data, f)
+        raw = orjson.dumps(session_data) if orjson else json.dumps(session_data).encode('utf-8')
+        tmp_path = SESSION_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, SESSION_FILE)
+        _session_cache = (os.path.getmtime(SESSION_FILE), session_data)
         logging.info("Session saved to file")
     except Exception as e:
         logging.error(f"Error saving session file: {e}")
 
+def _mark_validated(session_data):
+    """Remember that this session was just confirmed to be valid"""
+    global _last_validated
+    _last_validated = (session_data.get('timestamp'), time.time())
+
 def is_valid_session(session_data):
     """Check if the session data is valid and not expired"""
     if not session_data:
@@ -124,40 +203,40 @@ def is_valid_session(session_data):
     
     # Check if the session has expired
     timestamp = session_data.get('timestamp', 0)
-    if time.time() - timestamp > SESSION_TIMEOUT:
+    now = time.time()
+    if now - timestamp > SESSION_TIMEOUT:
         logging.info("Session has expired")
         return False
     
+    # Skip the network probe if this same session was confirmed valid recently
+    validated_timestamp, validated_at = _last_validated
+    if validated_timestamp == timestamp and now - validated_at < VALIDATION_TTL:
+        return True
+    
     # Try to make a test request to verify the session is still valid
     try:
-        cookies = {
-            name: value for name, value in session_data.get('cookies', {}).items()
-        }
+        cookies = session_data.get('cookies') or {}
         
-        # Make a request to a protected page
+        # Make a request to a protected page. The final URL and status are usually
+        # enough, so stream it and only read the body if we have to look inside
         test_url = f"{LIONEL_BASE_URL}/my/"
-        response = requests.get(test_url, cookies=cookies, timeout=10, allow_redirects=True)
-        
-        # If we get redirected to the login page, the session is invalid
-        if 'login' in response.url:
-            logging.info("Session cookies are no longer valid - redirected to login page")
-            return False
-            
-        # Check if we can find the user's name or a logout link on the page
-        # This is a more robust way to check if the session is valid
-        username = session_data.get('username', '')
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for elements that would indicate a valid session
-        user_elements = soup.find_all(string=lambda text: username in text if text else False)
-        logout_link = soup.find('a', string='Logout') or soup.find('a', string='Log out')
-        
-        if user_elements or logout_link or response.status_code == 200:
-            logging.info("Session appears to be valid")
-            return True
+        with _new_http_session().get(test_url, cookies=cookies, timeout=10, allow_redirects=True, stream=True) as response:
+            # If we get redirected to the login page, the session is invalid
+            if 'login' in response.url:
+                logging.info("Session cookies are no longer valid - redirected to login page")
+                return False
+                
+            # Check if we can find the user's name or a logout link on the page
+            # This is a more robust way to check if the session is valid
+            username = session_data.get('username', '')
             
-        logging.info(f"Session validation uncertain - status code: {response.status_code}")
-        return False
+            if response.status_code == 200 or _has_user_markers(response.content, username):
+                logging.info("Session appears to be valid")
+                _mark_validated(session_data)
+                return True
+                
+            logging.info(f"Session validation uncertain - status code: {response.status_code}")
+            return False
     except Exception as e:
         logging.error(f"Error testing session validity: {e}")
         return False
@@ -173,7 +252,8 @@ def login_to_lionel(username, password):
         dict: Session data including cookies and timestamp if successful, None otherwise
     """
     try:
-        session = requests.Session()
+        # Reuse the pooled connections, but give each login its own empty cookie jar
+        session = _new_http_session()
         
         # Get login page to extract login token
         logging.info("Fetching login page")
@@ -184,41 +264,25 @@ def login_to_lionel(username, password):
             logging.error(f"Failed to retrieve login page. Status code: {login_page.status_code}")
             return None
             
-        # Save the login page HTML for debugging
-        debug_html_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'login_page_debug.html')
-        with open(debug_html_path, 'w', encoding='utf-8') as f:
-            f.write(login_page.text)
-        logging.info(f"Saved login page HTML for debugging to: {debug_html_path}")
-        
-        soup = BeautifulSoup(login_page.content, 'html.parser')
+        # Save the login page HTML for debugging (only when asked for)
+        if logging.getLogger().isEnabledFor(logging.DEBUG) or os.getenv("LIONEL_DEBUG"):
+            with open(DEBUG_HTML_FILE, 'wb') as f:
+                f.write(login_page.content)
+            logging.info(f"Saved login page HTML for debugging to: {DEBUG_HTML_FILE}")
         
         # Extract any potential login token from the page
-        login_token = None
-        
-        # Try to find any logintoken input
-        token_input = soup.find('input', {'name': 'logintoken'})
-        if token_input:
-            login_token = token_input.get('value')
+        login_token = _find_login_token(login_page.content)
+        if login_token:
             logging.info("Found login token: %s", login_token)
         
         # If we couldn't find a logintoken, try to extract session key from page
         # This is an alternate approach since the login form doesn't have a login token
         if not login_token:
-            # Try to find the session key in JavaScript
-            scripts = soup.find_all('script')
-            sess_key = None
-            for script in scripts:
-                if script.string and 'sesskey' in script.string:
-                    import re
-                    match = re.search(r'sesskey":"([^"]+)"', script.string)
-                    if match:
-                        sess_key = match.group(1)
-                        logging.info("Found session key in script: %s", sess_key)
-                        break
-            
-            # If we found a session key, we'll use that instead
-            if sess_key:
-                login_token = sess_key
+            # Try to find the session key in the page's JavaScript config
+            match = SESSKEY_RE.search(login_page.content)
+            if match:
+                login_token = match.group(1).decode('utf-8', 'replace')
+                logging.info("Found session key in script: %s", login_token)
         
         # Prepare login data - note we're still proceeding without a login token
         # if one doesn't exist, as the site may not require it
@@ -244,29 +308,20 @@ def login_to_lionel(username, password):
             logging.info(f"Redirect location: {login_response.headers['Location']}")
         
         # Check if login was successful 
-        # Success criteria: either redirected away from login page or username appears in response
+        # Success criteria: either redirected away from login page or username appears in response.
+        # The URL settles the common case; otherwise the body is scanned once for an
+        # error box or the user's name / Logout link, and only then is the dashboard tried
         login_successful = False
         
-        # Method 1: Check if we're not on the login page anymore
         if 'login' not in login_response.url:
             login_successful = True
             logging.info("Login successful - redirected to non-login page")
-            
-        # Method 2: Check if login failed message appears on the page
-        if not login_successful:
-            login_soup = BeautifulSoup(login_response.content, 'html.parser')
-            if login_soup.find('div', class_='loginerrors'):
+        else:
+            body = login_response.content
+            if LOGIN_ERRORS_RE.search(body):
                 logging.error("Login failed - error message found on page")
                 return None
-            
-        # Method 3: Check if we can find the user's name or a logout link on the page
-        if not login_successful:
-            login_soup = BeautifulSoup(login_response.content, 'html.parser')
-            # Look for elements that would indicate a successful login
-            user_elements = login_soup.find_all(string=lambda text: username in text if text else False)
-            logout_link = login_soup.find('a', string='Logout') or login_soup.find('a', string='Log out')
-            
-            if user_elements or logout_link:
+            if _has_user_markers(body, username):
                 login_successful = True
                 logging.info("Login successful - user elements found on page")
         
@@ -289,10 +344,11 @@ def login_to_lionel(username, password):
         cookies = session.cookies.get_dict()
         
         # Print out all cookies for debugging
-        logging.info("Retrieved cookies:")
-        for name, value in cookies.items():
-            masked_value = value[:5] + "..." if len(value) > 10 else value
-            logging.info(f"  - {name}: {masked_value}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Retrieved cookies:")
+            for name, value in cookies.items():
+                masked_value = value[:5] + "..." if len(value) > 10 else value
+                logging.debug("  - %s: %s", name, masked_value)
         
         # Create session data with timestamp
         session_data = {
@@ -303,6 +359,7 @@ def login_to_lionel(username, password):
         
         # Save the session data
         save_session(session_data)
+        _mark_validated(session_data)
         
         logging.info("Login successful")
         return session_data
@@ -311,12 +368,22 @@ def login_to_lionel(username, password):
         logging.error(f"Login error: {e}")
         return None
 
-def get_session_cookies():
+def get_session_cookies(validate=True):
     """Get just the cookies from the session data in a format usable by requests
     
+    Args:
+        validate: If False, return the cached cookies without probing the site
+                  or logging in, as long as the session hasn't timed out
+    
     Returns:
         dict: Cookie dict or empty dict if no valid session
     """
+    if not validate:
+        session_data = load_session()
+        if session_data and time.time() - session_data.get('timestamp', 0) <= SESSION_TIMEOUT:
+            return session_data.get('cookies', {})
+        return {}
+    
     session_data = get_session_token()
     if session_data:
         return session_data.get('cookies', {})
@@ -3,13 +3,19 @@
 from dotenv import load_dotenv
 from datetime import datetime
 import os
+import re
 import sys
 import json
 import time
+import array
 import logging
 import socket
+import struct
 import threading
 import queue
+import select
+import bisect
+import functools
 import subprocess # Add subprocess import
 
 libdir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'lib')
@@ -34,6 +40,9 @@ except ImportError:
     bulletin_thread_function = None
     render_bulletin_screen = None
 
+# Width-based text clipping, shared with the bulletin screen so both cut text the same way
+from text_utils import fit_text
+
 # Setup font directories
 fontdir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'pic')
 fonts_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'fonts')
@@ -51,10 +60,14 @@ from TP_lib import epd2in9_V2 # Hardware specific, will error on dev machine
 from TP_lib import icnt86   # Hardware specific, will error on dev machine
 
 # Constants
-REFRESH_INTERVAL = 0.1
-PARTIAL_REFRESHES_BEFORE_FULL = 5
+REFRESH_INTERVAL = 0.1  # Shortest sleep between main loop passes
+TOUCH_COALESCE_WINDOW = 0.08  # Quiet time after a touch before redrawing, so a burst shares one frame
+TOUCH_COALESCE_MAX = 0.3  # Longest a steady stream of touches can hold back the redraw
+EINK_PARTIAL_ERASURE_LIMIT = 1500  # Pixels flipped by partial refreshes before ghosting calls for a full one
 WEATHER_UPDATE_INTERVAL = 600  # 10 minutes
+WEATHER_MAX_RETRY_INTERVAL = 3600  # Longest wait between attempts while weather fetches keep failing
 STATS_UPDATE_INTERVAL = 5
+NETWORK_UPDATE_INTERVAL = 300  # 5 minutes
 TIMETABLE_UPDATE_INTERVAL = 3600  # 1 hour
 BULLETIN_UPDATE_INTERVAL = 1800  # 30 minutes
 TIMETABLE_URL = os.getenv("TIMETABLE_URL")
@@ -71,12 +84,48 @@ logging.basicConfig(level=logging.INFO)
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Keep-alive HTTP session for the weather API, so each update reuses the connection
+if requests:
+    http_session = requests.Session()
+    http_session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2,
+                                              max_retries=Retry(total=2, backoff_factor=0.3)))
+    http_session.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=2,
+                                             max_retries=Retry(total=2, backoff_factor=0.3)))
+    http_session.headers.update({'User-Agent': 'EinkPDA/1.0', 'Accept-Encoding': 'gzip'})
+else:
+    http_session = None
+
+# Pull just the two weather fields out of the raw response instead of decoding the whole payload
+WEATHER_TEMP_RE = re.compile(rb'"main"\s*:\s*\{[^}]*?"temp"\s*:\s*(-?[0-9.]+(?:[eE][-+]?[0-9]+)?)')
+WEATHER_DESC_RE = re.compile(rb'"weather"\s*:\s*\[\s*\{[^}]*?"description"\s*:\s*"([^"\\]*)"')
+
+# Environment (.env) only needs loading once per run
+load_dotenv()
+
+# (st_mtime_ns, config) from the last time config.json was parsed
+_config_cache = (None, None)
+
 # Load configuration
 def load_config():
-    load_dotenv()
+    """Return the parsed config.json, re-reading it only when the file has changed"""
+    global _config_cache
+    try:
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return {'weather_enabled': False}
+    cached_mtime, cached_config = _config_cache
+    if cached_mtime == mtime:
+        return cached_config
     try:
         with open(CONFIG_PATH) as f:
             config = json.load(f)
@@ -84,15 +133,22 @@ def load_config():
                 config['weather_enabled'] = True
             else:
                 config['weather_enabled'] = False
-            return config
     except (FileNotFoundError, json.JSONDecodeError):
         return {'weather_enabled': False}
+    _config_cache = (mtime, config)
+    return config
 
 config = load_config()
 
+# Rotation is fixed for the run, so work out how frames are packed once
+DISPLAY_ROTATED = config.get('display_rotation') == 180  # Panel mounted upside down
+FRAME_TRANSPOSE = Image.ROTATE_270 if DISPLAY_ROTATED else Image.ROTATE_90
+
 # Touch variables
 current_screen = NETWORK_INFO_SCREEN
 touch_event = threading.Event()
+# Wakes the main loop early: set on touches and whenever a worker thread publishes new data
+wake_event = threading.Event()
 
 # Bulletin screen variables
 bulletin_scroll_position = 0
@@ -111,7 +167,317 @@ touch_old = icnt86.ICNT_Development()
 # Touch thread flag
 touch_thread_running = True
 
+# Bit-reversal table for each byte value, used to rotate packed 1-bit frames
+BITREV = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
+def get_frame_buffer(image):
+    """Pack an image for the display, applying the configured rotation.
+
+    A full-size 1-bit landscape frame is packed here directly: the panel wants it
+    turned 90 degrees (270 when the display is mounted upside down), and a
+    transpose followed by tobytes() is a single C pass that already gives the
+    MSB-first, 16 bytes per row layout the driver sends. Anything else goes
+    through epd.getbuffer.
+
+    For that path a 180 degree turn of a packed 1-bit frame is just the bytes in
+    reverse order with the bits of each byte reversed, so the rotation is folded
+    into the buffer instead of allocating a rotated image.
+    """
+    if image.mode == '1' and image.size == (epd.height, epd.width):
+        return bytearray(image.transpose(FRAME_TRANSPOSE).tobytes())
+    buf = epd.getbuffer(image)
+    if DISPLAY_ROTATED:
+        flipped = bytearray(buf)
+        flipped.reverse()
+        buf = flipped.translate(BITREV)
+    return buf
+
+def wait_for_touches_to_settle():
+    """Debounce touch-driven redraws.
+
+    Clears touch_event and keeps waiting while further touches arrive within
+    TOUCH_COALESCE_WINDOW of each other (capped at TOUCH_COALESCE_MAX), so fast
+    taps produce one e-ink update instead of one each.
+    """
+    deadline = time.monotonic() + TOUCH_COALESCE_MAX
+    touch_event.clear()
+    while touch_event.wait(TOUCH_COALESCE_WINDOW):
+        touch_event.clear()
+        if time.monotonic() >= deadline:
+            break
+
+# Packed buffer last sent to the panel, so unchanged frames can be skipped
+_last_frame_buffer = None
+# Pixels flipped by partial refreshes since the last full refresh (ghosting builds up with these)
+_partial_erasure = 0
+
+def _changed_pixels(old_buf, new_buf):
+    """Number of pixels that differ between two packed 1-bit frames"""
+    diff = int.from_bytes(old_buf, 'big') ^ int.from_bytes(new_buf, 'big')
+    if hasattr(diff, 'bit_count'):  # Python 3.10+, a popcount over the whole frame in C
+        return diff.bit_count()
+    return bin(diff).count('1')
+
+# Frame the display thread hasn't sent yet, as (packed buffer, full refresh?), or None
+_pending_frame = None
+_pending_frame_lock = threading.Lock()
+display_wake = threading.Event()  # Set when there is a frame for the display thread
+display_idle = threading.Event()  # Set while the display thread has nothing left to send
+display_idle.set()
+display_thread = None
+display_thread_running = True
+
+def _send_frame(buf, full):
+    """Send a packed frame to the panel.
+
+    Once the display thread is running the frame is only handed over, so the main
+    loop doesn't sit through the refresh. A frame still waiting is replaced by the
+    newer one (keeping it a full refresh if either was), so a burst of redraws
+    costs one panel update. Before that the frame is sent directly.
+    """
+    global _pending_frame
+    if display_thread is None:
+        if full:
+            epd.display_Base(buf)
+        else:
+            epd.display_Partial(buf)
+        return
+    with _pending_frame_lock:
+        if _pending_frame is not None and _pending_frame[1]:
+            full = True  # Don't lose a full refresh that was still waiting
+        _pending_frame = (buf, full)
+        display_idle.clear()
+    display_wake.set()
+
+def display_thread_function():
+    """Send frames handed over by _send_frame to the panel, one at a time"""
+    global _pending_frame
+    logging.info("Display thread started")
+    while display_thread_running:
+        display_wake.wait()
+        display_wake.clear()
+        while True:
+            with _pending_frame_lock:
+                frame = _pending_frame
+                _pending_frame = None
+                if frame is None:
+                    display_idle.set()
+                    break
+            buf, full = frame
+            try:
+                if full:
+                    epd.display_Base(buf)
+                else:
+                    epd.display_Partial(buf)
+            except Exception as e:
+                logging.error(f"Display error: {e}")
+    logging.info("Display thread exiting")
+
+def start_display_thread():
+    """Start sending frames from a background thread from now on"""
+    global display_thread
+    display_thread = threading.Thread(target=display_thread_function, daemon=True)
+    display_thread.start()
+    return display_thread
+
+def display_full(image):
+    """Full refresh with the given image (always sent, it also clears ghosting)"""
+    global _last_frame_buffer, _partial_erasure
+    buf = get_frame_buffer(image)
+    _send_frame(buf, True)
+    _last_frame_buffer = buf
+    _partial_erasure = 0
+
+def display_partial(image):
+    """Partial refresh with the given image, skipped if the panel already shows it
+
+    Promoted to a full refresh once partial refreshes have flipped more than
+    EINK_PARTIAL_ERASURE_LIMIT pixels, since ghosting follows how much of the
+    panel has changed rather than how many refreshes there were.
+    Returns True if the frame was sent (or handed to the display thread).
+    """
+    global _last_frame_buffer, _partial_erasure
+    buf = get_frame_buffer(image)
+    if buf == _last_frame_buffer:
+        logging.debug("Frame unchanged, skipping partial refresh")
+        return False
+    if _last_frame_buffer is not None and len(buf) == len(_last_frame_buffer):
+        _partial_erasure += _changed_pixels(_last_frame_buffer, buf)
+    if _partial_erasure > EINK_PARTIAL_ERASURE_LIMIT:
+        logging.info(f"Full refresh after {_partial_erasure} pixels changed by partial refreshes")
+        _send_frame(buf, True)
+        _partial_erasure = 0
+    else:
+        _send_frame(buf, False)
+    _last_frame_buffer = buf
+    return True
+
+# Last good weather result, kept across restarts so the main screen has weather straight away
+WEATHER_CACHE_FILE = os.path.expanduser("~/.eink_weather_cache.json")
+
+def _load_weather_cache():
+    """Weather cache tuple from the file saved by the last successful fetch, if it is usable"""
+    try:
+        with open(WEATHER_CACHE_FILE, 'r') as f:
+            saved = json.load(f)
+        age = max(time.time() - saved['fetched'], 0)
+        # Map the saved wall-clock time onto the monotonic clock get_weather() compares against
+        return (time.monotonic() - age, saved['unit'], saved['weather'],
+                saved.get('etag'), saved.get('last_modified'))
+    except (IOError, ValueError, KeyError, TypeError):
+        return (None, None, None, None, None)
+
+def _save_weather_cache(unit, weather, etag, last_modified):
+    """Save the latest weather and its validators for the next run"""
+    try:
+        with open(WEATHER_CACHE_FILE, 'w') as f:
+            json.dump({'unit': unit, 'weather': weather, 'etag': etag,
+                       'last_modified': last_modified, 'fetched': time.time()}, f)
+    except IOError as e:
+        logging.error(f"Error saving weather cache: {e}")
+
+# (monotonic time of the last fetch attempt, temperature unit, weather dict, ETag, Last-Modified)
+# for get_weather()
+_weather_cache = _load_weather_cache()
+# Weather fetches that have failed in a row; each one doubles the wait before the next attempt
+_weather_failures = 0
+
+@functools.lru_cache(maxsize=512)
+def _text_mask(font, text):
+    """Rasterize text once into a 1-bit mask, returned with its offset from the draw origin"""
+    left, top, right, bottom = font.getbbox(text, mode='1')
+    mask = Image.new('1', (max(right - left, 1), max(bottom - top, 1)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return (left, top), mask
+
+def draw_text(image, xy, text, font, fill=0):
+    """Same result as ImageDraw.text at integer xy, but each (font, text) pair is
+    only rasterized by FreeType once - labels, class names and most stats repeat
+    across frames, so later draws are a mask paste.
+    """
+    (left, top), mask = _text_mask(font, text)
+    image.paste(fill, (xy[0] + left, xy[1] + top), mask)
+
+@functools.lru_cache(maxsize=256)
+def _text_height(font, text):
+    """Ink height of text in font (bbox bottom - top), cached per (font, text)"""
+    left, top, right, bottom = font.getbbox(text)
+    return bottom - top
+
+
+# Timetable table on the right of the timetable screen
+TIMETABLE_PERIODS = range(1, 6)
+TIMETABLE_TOP = 22  # Y of the first period row
+TIMETABLE_RIGHT_X = 105  # Left edge of the right section, just past the divider
+TIMETABLE_ROW_HEIGHT = 20
+
+# screen -> (fonts, image) with the parts of that screen that never change
+SCREEN_TEMPLATES = {}
+
+def _draw_screen_chrome(screen, draw, fonts):
+    """Draw the static parts (buttons, bars, dividers, titles) of a screen"""
+    font_lg, font_md, font_sm, font_xs = fonts
+    if screen == MAIN_SCREEN:
+        # Draw button for Info screen
+        draw.rectangle([(250, 0), (295, 127)], outline=0) # Button border
+        draw.text((255, 60), "Info", font=font_sm, fill=0)   # Button text
+    elif screen == NETWORK_INFO_SCREEN:
+        # Title
+        draw.text((10, 10), "Network Information", font=font_md, fill=0)
+        # Draw button
+        draw.rectangle([(250, 0), (295, 127)], outline=0)
+        draw.text((255, 60), "Next", font=font_sm, fill=0)
+    elif screen == TIMETABLE_SCREEN:
+        # Top bar for the time and date, with the separator between them
+        draw.rectangle([(0, 0), (epd.height, 15)], outline=0, fill=0)
+        draw.text((epd.height//2 - 10, 1), "|", font=font_sm, fill=255)
+        # Make the Next button smaller and more stylish in the top right
+        draw.rectangle([(270, 0), (295, 15)], outline=0, fill=0)
+        draw.text((273, 1), "Next", font=font_xs, fill=255)
+        # Vertical divider between the left and right sections
+        draw.line([(100, 20), (100, 127)], fill=0, width=1)
+        # Period rows: alternating backgrounds and the P1-P5 labels never change
+        right_y = TIMETABLE_TOP
+        for period in TIMETABLE_PERIODS:
+            if period % 2 == 0:
+                draw.rectangle([(TIMETABLE_RIGHT_X, right_y),
+                                (epd.height-5, right_y + TIMETABLE_ROW_HEIGHT - 1)], outline=0, fill=255)
+            period_text = f"P{period}:"
+            period_dy = (TIMETABLE_ROW_HEIGHT - _text_height(font_md, period_text)) // 2 - 5  # Shifted up
+            draw.text((TIMETABLE_RIGHT_X + 5, right_y + period_dy), period_text, font=font_md, fill=0)
+            right_y += TIMETABLE_ROW_HEIGHT
+
+# screen -> image reused as the frame for every redraw of that screen
+SCREEN_FRAMES = {}
+
+def _screen_template(screen, fonts):
+    """The cached image of a screen's static chrome (not to be drawn on)"""
+    template = SCREEN_TEMPLATES.get(screen)
+    if template is None or template[0] is not fonts:
+        image = Image.new('1', (epd.height, epd.width), 255)  # White background
+        _draw_screen_chrome(screen, ImageDraw.Draw(image), fonts)
+        template = (fonts, image)
+        SCREEN_TEMPLATES[screen] = template
+    return template[1]
+
+def new_screen_image(screen, fonts):
+    """Return a fresh image for a screen with its static chrome already drawn"""
+    return _screen_template(screen, fonts).copy()
+
+def reuse_screen_image(screen, base):
+    """Reset the screen's frame image to base and return it.
+
+    Frames are packed and sent as soon as they are drawn, so each screen keeps
+    one image and overwrites it in place instead of allocating a new one per
+    redraw. The returned image is overwritten by the next redraw of the same
+    screen; copy it to keep it longer.
+    """
+    frame = SCREEN_FRAMES.get(screen)
+    if frame is None or frame.size != base.size:
+        frame = base.copy()
+        SCREEN_FRAMES[screen] = frame
+    else:
+        frame.paste(base)
+    return frame
+
 def get_weather():
+    """Return current weather, fetching at most once per WEATHER_UPDATE_INTERVAL.
+
+    Calls in between get the cached result. If a fetch fails, the last good
+    result is kept until the next attempt is due. Each failure in a row doubles
+    the wait before that attempt (up to WEATHER_MAX_RETRY_INTERVAL), so an
+    offline device or a missing API key doesn't keep retrying at the normal rate.
+    """
+    global _weather_cache, _weather_failures
+    fetched_at, cached_unit, cached_weather, etag, last_modified = _weather_cache
+    unit = config.get('temperature_unit', 'C')
+    now = time.monotonic()
+    interval = min(WEATHER_UPDATE_INTERVAL * 2 ** _weather_failures, WEATHER_MAX_RETRY_INTERVAL)
+    # A second of slack, since the data thread's passes don't start at exactly the same point in each interval
+    if fetched_at is not None and cached_unit == unit and now - fetched_at < interval - 1:
+        return cached_weather
+
+    logging.info("Updating weather data")
+    if cached_unit != unit:
+        # The validators belong to the other unit's URL
+        cached_weather = etag = last_modified = None
+    result = _fetch_weather(unit, cached_weather, etag, last_modified)
+    if result is None:
+        _weather_failures = min(_weather_failures + 1, 8)
+        _weather_cache = (now, unit, cached_weather, etag, last_modified)
+        return cached_weather
+    _weather_failures = 0
+    weather, etag, last_modified = result
+    _weather_cache = (now, unit, weather, etag, last_modified)
+    _save_weather_cache(unit, weather, etag, last_modified)
+    return weather
+
+def _fetch_weather(unit, cached_weather=None, etag=None, last_modified=None):
+    """Fetch the current weather, as (weather, ETag, Last-Modified) or None on failure.
+
+    If there is a cached result its validators are sent along, and a 304
+    answer returns the cached weather without downloading it again.
+    """
     if not requests:
         logging.warning("Requests library not available. Cannot fetch weather.")
         return None
@@ -123,31 +489,49 @@ def get_weather():
 
     city = 'Hong Kong'
     country_code = 'HK'
-    unit = config.get('temperature_unit', 'C')
     units_param = 'metric' if unit == 'C' else 'imperial'
     
     url = f"http://api.openweathermap.org/data/2.5/weather?q={city},{country_code}&appid={api_key}&units={units_param}"
     
     try:
-        response = requests.get(url, timeout=10)
+        conditional_headers = {}
+        if cached_weather is not None:
+            if etag:
+                conditional_headers['If-None-Match'] = etag
+            if last_modified:
+                conditional_headers['If-Modified-Since'] = last_modified
+        response = http_session.get(url, headers=conditional_headers, timeout=(3, 10))  # (connect, read) timeouts
+        if response.status_code == 304 and cached_weather is not None:
+            logging.info("Weather not modified on server, keeping cached data")
+            return cached_weather, etag, last_modified
         response.raise_for_status()  # Raises an HTTPError for bad responses (4XX or 5XX)
-        data = response.json()
-        
-        if data.get('cod') != 200:
-            logging.error(f"Weather API error: {data.get('message', 'Unknown error')}")
-            return None
-            
-        temp = data.get('main', {}).get('temp')
-        description = data.get('weather', [{}])[0].get('description')
+        content = response.content
+        temp_match = WEATHER_TEMP_RE.search(content)
+        desc_match = WEATHER_DESC_RE.search(content)
+
+        if temp_match and desc_match:
+            temp = float(temp_match.group(1))
+            description = desc_match.group(1).decode('utf-8')
+        else:
+            # Escaped or unexpected layout, fall back to a full decode
+            data = json.loads(content)
+
+            if data.get('cod') != 200:
+                logging.error(f"Weather API error: {data.get('message', 'Unknown error')}")
+                return None
+
+            temp = data.get('main', {}).get('temp')
+            description = data.get('weather', [{}])[0].get('description')
 
         if temp is None or description is None:
             logging.error("Weather data incomplete in API response.")
             return None
 
-        return {
+        weather = {
             'temp': temp,
             'description': description
         }
+        return weather, response.headers.get('ETag'), response.headers.get('Last-Modified')
     except requests.exceptions.RequestException as e:
         logging.error(f"Weather request failed: {e}")
         return None
@@ -158,110 +542,272 @@ def get_weather():
         logging.error(f"An unexpected error occurred in get_weather: {e}")
         return None
 
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+MEMINFO_PATH = '/proc/meminfo'
+
+# path -> file descriptor kept open for the data thread, so each sample is a single pread()
+_stat_fds = {}
+
+def _read_stat_file(path, size=4096):
+    """Read a small /proc or /sys file from the start through a cached descriptor"""
+    fd = _stat_fds.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_RDONLY)
+        _stat_fds[path] = fd
+    return os.pread(fd, size, 0)
+
 def get_system_stats():
     """Get system statistics like CPU temperature and memory usage."""
     stats = {'cpu_temp': None, 'mem_usage': None}
 
-    # CPU Temperature (Raspberry Pi specific)
+    # CPU Temperature - read the kernel's thermal zone (millidegrees C) directly
     try:
-        # Use subprocess for better error handling and to capture output
-        result = subprocess.check_output(['vcgencmd', 'measure_temp'], text=True)
-        # Example output: temp=45.5'C
-        stats['cpu_temp'] = float(result.split('=')[1].split("'")[0])
-    except FileNotFoundError:
-        # vcgencmd not found, likely not a Raspberry Pi or not in PATH
-        logging.info("vcgencmd command not found. CPU temperature not available.")
-    except (IndexError, ValueError, subprocess.CalledProcessError) as e:
-        logging.warning(f"Could not parse CPU temperature: {e}")
-    except Exception as e: # Catch any other unexpected errors
-        logging.error(f"An unexpected error occurred while getting CPU temperature: {e}")
-
-    # Memory Usage - using free command
+        stats['cpu_temp'] = round(int(_read_stat_file(THERMAL_ZONE_PATH, 16)) / 1000.0, 1)
+    except (OSError, ValueError, AttributeError):  # AttributeError: no os.pread on this platform
+        # No thermal zone exposed, fall back to vcgencmd (Raspberry Pi specific)
+        try:
+            # Use subprocess for better error handling and to capture output
+            result = subprocess.check_output(['vcgencmd', 'measure_temp'], text=True)
+            # Example output: temp=45.5'C
+            stats['cpu_temp'] = float(result.split('=')[1].split("'")[0])
+        except FileNotFoundError:
+            # vcgencmd not found, likely not a Raspberry Pi or not in PATH
+            logging.info("vcgencmd command not found. CPU temperature not available.")
+        except (IndexError, ValueError, subprocess.CalledProcessError) as e:
+            logging.warning(f"Could not parse CPU temperature: {e}")
+        except Exception as e: # Catch any other unexpected errors
+            logging.error(f"An unexpected error occurred while getting CPU temperature: {e}")
+
+    # Memory Usage - from /proc/meminfo, used = total - available (what 'free' reports)
     try:
-        # Use subprocess for the free command
-        result = subprocess.check_output("free | grep Mem | awk '{print int($3/$2 * 100)}'", shell=True, text=True)
-        stats['mem_usage'] = int(result.strip())
-    except (ValueError, subprocess.CalledProcessError) as e:
-        logging.warning(f"'free' command failed to get memory usage: {e}")
+        # MemTotal and MemAvailable are in the first few lines, no need to split the rest
+        meminfo = {}
+        for line in _read_stat_file(MEMINFO_PATH, 512).split(b'\n', 3)[:3]:
+            key, _, value = line.partition(b':')
+            meminfo[key] = value
+        mem_total = int(meminfo[b'MemTotal'].split()[0])
+        mem_available = int(meminfo[b'MemAvailable'].split()[0])
+        stats['mem_usage'] = int((mem_total - mem_available) * 100 / mem_total)
+    except (OSError, KeyError, IndexError, ValueError, ZeroDivisionError, AttributeError) as e:
+        logging.warning(f"Could not read memory usage from {MEMINFO_PATH}: {e}")
     except Exception as e: # Catch any other unexpected errors
-        logging.error(f"An unexpected error occurred while getting memory usage with 'free': {e}")
+        logging.error(f"An unexpected error occurred while getting memory usage: {e}")
             
     return stats
 
-def draw_time_image(fonts, weather_data, stats):
-    font_lg, font_md, font_sm, _ = fonts  # Unpack needed fonts, ignore xs
-    image = Image.new('1', (epd.height, epd.width), 255)  # White background
-    draw = ImageDraw.Draw(image)
-    
-    now = datetime.now()
-    current_time = now.strftime("%H:%M")
-    current_date = now.strftime("%Y-%m-%d")
+# (minute, "HH:MM", "DD/MM/YYYY", "YYYY-MM-DD") for the last minute that was formatted
+_clock_strings_cache = (None, None, None, None)
+
+def clock_strings(now):
+    """Return ("HH:MM", "DD/MM/YYYY", "YYYY-MM-DD") for now.
+
+    Built straight from the datetime fields instead of strftime, and reused for
+    every redraw within the same minute.
+    """
+    global _clock_strings_cache
+    minute = (now.year, now.month, now.day, now.hour, now.minute)
+    if _clock_strings_cache[0] != minute:
+        _clock_strings_cache = (minute,
+                                f"{now.hour:02d}:{now.minute:02d}",
+                                f"{now.day:02d}/{now.month:02d}/{now.year}",
+                                f"{now.year}-{now.month:02d}-{now.day:02d}")
+    return _clock_strings_cache[1:]
+
+# (key, image) for the main screen with the clock and weather drawn but no stats
+_time_base_cache = (None, None)
+
+def _draw_time_base(fonts, current_time, current_date, weather_text):
+    """Main screen with everything but the system stats, cached until any of it changes"""
+    global _time_base_cache
+    key = (fonts, current_time, current_date, weather_text)
+    cached_key, cached_image = _time_base_cache
+    if cached_key == key:
+        return cached_image
+
+    font_lg, font_md, font_sm, _ = fonts
+    image = new_screen_image(MAIN_SCREEN, fonts)  # Info button already drawn
     
     # Draw time and date
-    draw.text((20, 10), current_time, font=font_lg, fill=0)
-    draw.text((20, 45), current_date, font=font_md, fill=0)
+    draw_text(image, (20, 10), current_time, font=font_lg, fill=0)
+    draw_text(image, (20, 45), current_date, font=font_md, fill=0)
     
     # Draw weather
-    y_pos = 80
+    if weather_text:
+        draw_text(image, (20, 80), fit_text(weather_text, font_md, 225), font=font_md, fill=0)  # Stop short of the Info button
+    
+    _time_base_cache = (key, image)
+    return image
+
+def draw_time_image(fonts, weather_data, stats, now=None):
+    font_lg, font_md, font_sm, _ = fonts  # Unpack needed fonts, ignore xs
+    
+    if now is None:
+        now = datetime.now()
+    current_time, _, current_date = clock_strings(now)
+    weather_text = None
     if weather_data:
         temp_unit = config.get('temperature_unit', 'C')
         weather_text = f"{weather_data['temp']:.1f}°{temp_unit} {weather_data['description']}"
-        draw.text((20, y_pos), weather_text[:32], font=font_md, fill=0)
-        y_pos += 25 # Increment y_pos for next element
+    
+    # Clock and weather only change once a minute, stats every few seconds, so
+    # reuse the clock/weather part and only draw the stats over a copy of it
+    image = reuse_screen_image(MAIN_SCREEN, _draw_time_base(fonts, current_time, current_date, weather_text))
+    y_pos = 105 if weather_text else 80  # Stats go below the weather line, if there is one
     
     # System stats
     if stats.get('cpu_temp') is not None:
         cpu_text = f"CPU: {stats['cpu_temp']}°C"
-        draw.text((20, y_pos), cpu_text, font=font_sm, fill=0)
+        draw_text(image, (20, y_pos), cpu_text, font=font_sm, fill=0)
         if stats.get('mem_usage') is not None:
             mem_text = f"Mem: {stats['mem_usage']}%"
-            draw.text((100, y_pos), mem_text, font=font_sm, fill=0) # Positioned to the right of CPU temp
-    
-    # Draw button for Info screen
-    draw.rectangle([(250, 0), (295, 127)], outline=0) # Button border
-    draw.text((255, 60), "Info", font=font_sm, fill=0)   # Button text
-    
-    if config.get('display_rotation') == 180:
-        image = image.rotate(180)
+            draw_text(image, (100, y_pos), mem_text, font=font_sm, fill=0) # Positioned to the right of CPU temp
     
     return image
 
-def get_network_info():
-    """Get network information including WiFi SSID, IP address, and hostname."""
-    info = {
-        'wifi': "N/A",
-        'ip': "N/A",
-        'hostname': "pda.local"  # Default, can be overridden
-    }
+NETWORK_INFO_TTL = 30  # Seconds to reuse the IP/SSID lookup
+
+# Hostname is resolved once per process; (monotonic time, info dict) for the rest
+_hostname = None
+_network_info_cache = (None, None)
 
-    # Get hostname
+def _get_hostname():
+    """Return the mDNS-style hostname, looked up on first use and then reused."""
+    global _hostname
+    if _hostname is not None:
+        return _hostname
+
+    hostname_local = "pda.local"  # Default, can be overridden
     try:
         hostname = socket.gethostname()
         if hostname: # Ensure hostname is not empty
-            info['hostname'] = f"{hostname}.local"
+            hostname_local = f"{hostname}.local"
     except socket.gaierror as e:
-        logging.warning(f"Could not get hostname: {e}. Using default '{info['hostname']}'.")
+        logging.warning(f"Could not get hostname: {e}. Using default '{hostname_local}'.")
     except Exception as e:
-        logging.error(f"Unexpected error getting hostname: {e}. Using default '{info['hostname']}'.")
+        logging.error(f"Unexpected error getting hostname: {e}. Using default '{hostname_local}'.")
+    _hostname = hostname_local
+    return _hostname
 
-    # Get IP address
-    s = None # Ensure s is defined for finally block
+def get_network_info():
+    """Get network information including WiFi SSID, IP address, and hostname.
+
+    The IP and SSID lookups are reused for NETWORK_INFO_TTL seconds.
+    """
+    global _network_info_cache
+    fetched_at, cached_info = _network_info_cache
+    now = time.monotonic()
+    if fetched_at is not None and now - fetched_at < NETWORK_INFO_TTL:
+        return dict(cached_info)
+
+    info = _read_network_info()
+    _network_info_cache = (now, info)
+    return dict(info)
+
+# Wireless extensions ioctl used by iwgetid to read the SSID
+PROC_NET_WIRELESS_PATH = '/proc/net/wireless'
+SIOCGIWESSID = 0x8B1B
+IW_ESSID_MAX_SIZE = 32
+IWREQ_SIZE = 32  # sizeof(struct iwreq): 16-byte name + 16-byte union
+
+def _get_wifi_ssid():
+    """Read the SSID of the first wireless interface with the SIOCGIWESSID ioctl.
+
+    Returns '' when no interface is associated, or None when wireless extensions
+    are not available here and the caller should fall back to iwgetid.
+    """
+    if fcntl is None:
+        return None
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(1.0) # Add a timeout to prevent long hangs
-        s.connect(("8.8.8.8", 80))  # Connect to a known external server (doesn't send data)
-        info['ip'] = s.getsockname()[0]
-    except socket.timeout:
-        logging.warning("Timeout when trying to get IP address. Network might be down or slow.")
-    except OSError as e: # Catches socket.error and other OS-level errors
-        logging.warning(f"Could not get IP address: {e}")
-    except Exception as e:
-        logging.error(f"Unexpected error getting IP address: {e}")
-    finally:
-        if s:
-            s.close()
+        with open(PROC_NET_WIRELESS_PATH) as f:
+            # Two header lines, then one "iface: ..." line per wireless interface
+            interfaces = [line.split(':', 1)[0].strip() for line in f.readlines()[2:] if ':' in line]
+    except OSError:
+        return None
+
+    essid = array.array('B', bytes(IW_ESSID_MAX_SIZE + 1))
+    essid_addr, essid_len = essid.buffer_info()  # The kernel writes the SSID straight into this buffer
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for ifname in interfaces:
+            request = struct.pack('16sPHH', ifname.encode(), essid_addr, essid_len, 0)
+            try:
+                result = fcntl.ioctl(s.fileno(), SIOCGIWESSID, request.ljust(IWREQ_SIZE, b'\0'))
+            except OSError as e:
+                logging.debug("SIOCGIWESSID failed on %s: %s", ifname, e)
+                continue
+            length = struct.unpack_from('16sPHH', result)[2]
+            ssid = essid[:length].tobytes().rstrip(b'\0').decode('utf-8', 'replace')
+            if ssid:
+                return ssid
+    return ''
+
+# Default-route interface and its IPv4 address, read without opening a connection
+PROC_NET_ROUTE_PATH = '/proc/net/route'
+SIOCGIFADDR = 0x8915
+RTF_UP = 0x1
+IFREQ_SIZE = 40  # sizeof(struct ifreq) on 64-bit; large enough for 32-bit too
+
+def _get_default_route_ip():
+    """IPv4 address of the interface that carries the default route, or None if unknown"""
+    if fcntl is None:
+        return None
+    try:
+        with open(PROC_NET_ROUTE_PATH) as f:
+            next(f)  # Header line
+            for line in f:
+                fields = line.split()
+                # Iface, Destination, Gateway, Flags, ... - destination 0.0.0.0 is the default route
+                if len(fields) > 3 and fields[1] == '00000000' and int(fields[3], 16) & RTF_UP:
+                    ifname = fields[0]
+                    break
+            else:
+                return None
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            result = fcntl.ioctl(s.fileno(), SIOCGIFADDR, struct.pack('16s', ifname.encode()).ljust(IFREQ_SIZE, b'\0'))
+        return socket.inet_ntoa(result[20:24])  # sockaddr_in.sin_addr inside ifr_addr
+    except (OSError, ValueError, StopIteration) as e:
+        logging.debug("Default route address lookup failed: %s", e)
+        return None
+
+def _read_network_info():
+    info = {
+        'wifi': "N/A",
+        'ip': "N/A",
+        'hostname': _get_hostname()
+    }
+
+    # Get IP address - from the default route's interface if possible, otherwise
+    # let a UDP connect() pick the outgoing address
+    route_ip = _get_default_route_ip()
+    if route_ip is not None:
+        info['ip'] = route_ip
+    else:
+        s = None # Ensure s is defined for finally block
+        try:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.settimeout(1.0) # Add a timeout to prevent long hangs
+            s.connect(("8.8.8.8", 80))  # Connect to a known external server (doesn't send data)
+            info['ip'] = s.getsockname()[0]
+        except socket.timeout:
+            logging.warning("Timeout when trying to get IP address. Network might be down or slow.")
+        except OSError as e: # Catches socket.error and other OS-level errors
+            logging.warning(f"Could not get IP address: {e}")
+        except Exception as e:
+            logging.error(f"Unexpected error getting IP address: {e}")
+        finally:
+            if s:
+                s.close()
+
+    # Get WiFi network name (SSID) - Linux specific, straight from the kernel when possible
+    wifi_name = _get_wifi_ssid()
+    if wifi_name is not None:
+        if wifi_name:
+            info['wifi'] = wifi_name
+        else:
+            logging.info("No wireless interface is associated, possibly not connected to WiFi.")
+            info['wifi'] = "Not Connected"
+        return info
 
-    # Get WiFi network name (SSID) - Linux specific using iwgetid
+    # Fall back to iwgetid where wireless extensions cannot be queried directly
     try:
         process = subprocess.run(['iwgetid', '-r'], capture_output=True, text=True, check=False, timeout=5)
         if process.returncode == 0:
@@ -287,6 +833,11 @@ def get_network_info():
         
     return info
 
+@functools.lru_cache(maxsize=32)
+def _load_font(path, size):
+    """Load a TrueType font once per (path, size) and share it from then on"""
+    return ImageFont.truetype(path, size)
+
 def initialize_fonts():
     """Initialize fonts without refreshing the display"""
     logging.info("Initializing fonts")
@@ -296,10 +847,10 @@ def initialize_fonts():
         if all(os.path.exists(p) for p in [REDHAT_BOLD_PATH, REDHAT_MEDIUM_PATH, REDHAT_REGULAR_PATH]):
             logging.info("Using Red Hat Display fonts")
             return (
-                ImageFont.truetype(REDHAT_BOLD_PATH, 24),
-                ImageFont.truetype(REDHAT_MEDIUM_PATH, 18), 
-                ImageFont.truetype(REDHAT_REGULAR_PATH, 12),
-                ImageFont.truetype(REDHAT_REGULAR_PATH, 10)  # Extra small font for timetable
+                _load_font(REDHAT_BOLD_PATH, 24),
+                _load_font(REDHAT_MEDIUM_PATH, 18), 
+                _load_font(REDHAT_REGULAR_PATH, 12),
+                _load_font(REDHAT_REGULAR_PATH, 10)  # Extra small font for timetable
             )
         else:
             logging.warning("Red Hat Display fonts not found. Falling back to default font.")
@@ -309,12 +860,153 @@ def initialize_fonts():
     # Fallback to default font
     logging.info("Using default font")
     return (
-        ImageFont.truetype(FONT_PATH, 24),
-        ImageFont.truetype(FONT_PATH, 18),
-        ImageFont.truetype(FONT_PATH, 12),
-        ImageFont.truetype(FONT_PATH, 10)  # Extra small font for timetable
+        _load_font(FONT_PATH, 24),
+        _load_font(FONT_PATH, 18),
+        _load_font(FONT_PATH, 12),
+        _load_font(FONT_PATH, 10)  # Extra small font for timetable
     )
 
+# --- Touch hitboxes ---
+# Each row is (x_min, x_max, y_min, y_max, action); the first row containing the
+# touch wins, so rows are listed in priority order.
+TOUCH_BACK = 0
+TOUCH_CONTENT_SCROLL_UP = 1
+TOUCH_CONTENT_SCROLL_DOWN = 2
+TOUCH_LIST_SCROLL_UP = 3
+TOUCH_LIST_SCROLL_DOWN = 4
+TOUCH_NEXT_SCREEN = 5
+
+# Viewing an item's content, at the top / scrolled down
+BULLETIN_CONTENT_HITBOXES_TOP = (
+    (5, 50, 20, 35, TOUCH_BACK),                   # Back button (top of content)
+    (5, 110, 116, 127, TOUCH_BACK),                # "Return to List" button at bottom
+    (270, 290, 95, 110, TOUCH_CONTENT_SCROLL_DOWN),
+)
+BULLETIN_CONTENT_HITBOXES_SCROLLED = (
+    (5, 50, 0, 15, TOUCH_BACK),                    # Back button (scrolled content)
+    (5, 110, 116, 127, TOUCH_BACK),                # "Return to List" button at bottom
+    (270, 290, 45, 60, TOUCH_CONTENT_SCROLL_UP),
+    (270, 290, 95, 110, TOUCH_CONTENT_SCROLL_DOWN),
+)
+# Viewing the list of bulletin items, at the top / scrolled down
+BULLETIN_LIST_HITBOXES_TOP = (
+    (270, 290, 95, 110, TOUCH_LIST_SCROLL_DOWN),
+)
+BULLETIN_LIST_HITBOXES_SCROLLED = (
+    (270, 290, 20, 35, TOUCH_LIST_SCROLL_UP),
+    (270, 290, 95, 110, TOUCH_LIST_SCROLL_DOWN),
+)
+BULLETIN_ITEM_SELECT_AREA_X_MAX = 265
+
+def _build_item_hit_regions(scrolled):
+    """Top and bottom edges of each tappable list row, in screen order"""
+    start_y = 25 if scrolled else 45
+    item_height_plus_spacing = 33 # Approx height + spacing
+    items_on_screen = 4 if scrolled else 3
+    tops = tuple(start_y + (i * item_height_plus_spacing) - 3 for i in range(items_on_screen))
+    bottoms = tuple(top + 25 for top in tops) # Approx item clickable height
+    return tops, bottoms
+
+# List scrolled down -> (row tops, row bottoms); rows don't overlap so bottoms stay sorted
+BULLETIN_ITEM_HIT_REGIONS = {scrolled: _build_item_hit_regions(scrolled) for scrolled in (False, True)}
+
+# Navigation button per screen: a small "Next" in the top right on the timetable
+# and bulletin screens, the full-height right-hand button everywhere else
+NAV_HITBOX_SMALL = (270, 295, 0, 15, TOUCH_NEXT_SCREEN)
+NAV_HITBOX_COMMON = (250, 295, 0, 127, TOUCH_NEXT_SCREEN)
+
+def _build_hitbox_table(screen, viewing_item, scrolled):
+    """Every hitbox that can be pressed on screen in the given bulletin substate"""
+    if screen != BULLETIN_SCREEN:
+        return (NAV_HITBOX_SMALL if screen == TIMETABLE_SCREEN else NAV_HITBOX_COMMON,)
+    if viewing_item:
+        rows = BULLETIN_CONTENT_HITBOXES_SCROLLED if scrolled else BULLETIN_CONTENT_HITBOXES_TOP
+    else:
+        rows = BULLETIN_LIST_HITBOXES_SCROLLED if scrolled else BULLETIN_LIST_HITBOXES_TOP
+    return rows + (NAV_HITBOX_SMALL,)
+
+# (screen, viewing a bulletin item, scrolled down) -> hitboxes live in that state
+HITBOX_TABLES = {
+    (screen, viewing_item, scrolled): _build_hitbox_table(screen, viewing_item, scrolled)
+    for screen in (NETWORK_INFO_SCREEN, MAIN_SCREEN, TIMETABLE_SCREEN, BULLETIN_SCREEN)
+    for viewing_item in (False, True)
+    for scrolled in (False, True)
+}
+
+def _active_hitbox_table():
+    """Look up the hitbox table for the current screen and bulletin state"""
+    viewing_item = bulletin_selected_item is not None
+    if current_screen != BULLETIN_SCREEN:
+        return HITBOX_TABLES[(current_screen, False, False)]
+    scroll = bulletin_content_scroll_position if viewing_item else bulletin_scroll_position
+    return HITBOX_TABLES[(current_screen, viewing_item, scroll > 0)]
+
+TOUCH_IDLE_WAIT = 0.5  # Longest the touch thread blocks waiting for an INT edge
+
+# (pin, value file, epoll object, exported by us) while INT edge detection is open
+_touch_int_edge = None
+
+def _open_touch_int_edge(pin):
+    """Set up a falling-edge wait on the touch INT pin through sysfs GPIO.
+
+    Returns a wait(timeout) function that blocks until the pin falls (a new touch)
+    or the timeout passes, or None if edge detection isn't available, in which
+    case the caller keeps polling the pin.
+    """
+    global _touch_int_edge
+    gpio_dir = f"/sys/class/gpio/gpio{pin}"
+    value_file = None
+    exported = False
+    try:
+        if not os.path.exists(gpio_dir):
+            with open("/sys/class/gpio/export", "w") as f:
+                f.write(str(pin))
+            exported = True
+        with open(os.path.join(gpio_dir, "edge"), "w") as f:
+            f.write("falling")
+        value_file = open(os.path.join(gpio_dir, "value"), "rb", buffering=0)
+        value_file.read()  # Clear any edge that is already pending
+        poller = select.epoll()
+        poller.register(value_file.fileno(), select.EPOLLPRI | select.EPOLLERR)
+    except (OSError, AttributeError, ValueError) as e:
+        # Sysfs GPIO is deprecated and missing on newer kernels, so polling stays the fallback
+        logging.info(f"Touch INT edge detection not available ({e}), polling instead")
+        _touch_int_edge = (pin, value_file, None, exported)
+        _close_touch_int_edge()
+        return None
+
+    _touch_int_edge = (pin, value_file, poller, exported)
+
+    def wait(timeout):
+        if poller.poll(timeout):
+            value_file.seek(0)
+            value_file.read()  # Acknowledge the edge
+
+    logging.info(f"Waiting on touch INT edges via {gpio_dir}")
+    return wait
+
+def _close_touch_int_edge():
+    """Release the touch INT epoll object and value file, and unexport the pin if we exported it"""
+    global _touch_int_edge
+    if _touch_int_edge is None:
+        return
+    pin, value_file, poller, exported = _touch_int_edge
+    _touch_int_edge = None
+    if poller is not None:
+        try:
+            poller.unregister(value_file.fileno())
+        except (OSError, ValueError):
+            pass
+        poller.close()
+    if value_file is not None:
+        value_file.close()
+    if exported:
+        try:
+            with open("/sys/class/gpio/unexport", "w") as f:
+                f.write(str(pin))
+        except OSError as e:
+            logging.warning(f"Could not unexport touch INT GPIO {pin}: {e}")
+
 def touch_detection_thread():
     """Thread function for touch detection using INT pin method."""
     # Globals accessed by this thread and its helpers
@@ -331,157 +1023,69 @@ def touch_detection_thread():
     last_touch_time = 0
     debounce_time = 0.3  # Reduced to 0.3 seconds for faster response
 
-    # --- Touch Area Constants ---
-    # Common navigation button (right side of screen)
-    NAV_BUTTON_COMMON_X_MIN, NAV_BUTTON_COMMON_X_MAX = 250, 295
-    NAV_BUTTON_COMMON_Y_MIN, NAV_BUTTON_COMMON_Y_MAX = 0, 127
-
-    # Navigation button for Timetable screen (smaller, top right)
-    NAV_BUTTON_TIMETABLE_X_MIN, NAV_BUTTON_TIMETABLE_X_MAX = 270, 295
-    NAV_BUTTON_TIMETABLE_Y_MIN, NAV_BUTTON_TIMETABLE_Y_MAX = 0, 15
-
-    # Navigation button for Bulletin screen (top right, acts as "Next")
-    NAV_BUTTON_BULLETIN_X_MIN, NAV_BUTTON_BULLETIN_X_MAX = 270, 295
-    NAV_BUTTON_BULLETIN_Y_MIN, NAV_BUTTON_BULLETIN_Y_MAX = 0, 15
-
-    # Bulletin screen specific areas
-    BULLETIN_BACK_BUTTON_SCROLLED_X_MIN, BULLETIN_BACK_BUTTON_SCROLLED_X_MAX = 5, 50
-    BULLETIN_BACK_BUTTON_SCROLLED_Y_MIN, BULLETIN_BACK_BUTTON_SCROLLED_Y_MAX = 0, 15
-
-    BULLETIN_BACK_BUTTON_TOP_X_MIN, BULLETIN_BACK_BUTTON_TOP_X_MAX = 5, 50
-    BULLETIN_BACK_BUTTON_TOP_Y_MIN, BULLETIN_BACK_BUTTON_TOP_Y_MAX = 20, 35
-    
-    BULLETIN_RETURN_TO_LIST_BOTTOM_X_MIN, BULLETIN_RETURN_TO_LIST_BOTTOM_X_MAX = 5, 110
-    BULLETIN_RETURN_TO_LIST_BOTTOM_Y_MIN, BULLETIN_RETURN_TO_LIST_BOTTOM_Y_MAX = 116, 127
-
-    BULLETIN_CONTENT_SCROLL_UP_X_MIN, BULLETIN_CONTENT_SCROLL_UP_X_MAX = 270, 290
-    BULLETIN_CONTENT_SCROLL_UP_Y_MIN, BULLETIN_CONTENT_SCROLL_UP_Y_MAX = 45, 60
-
-    BULLETIN_CONTENT_SCROLL_DOWN_X_MIN, BULLETIN_CONTENT_SCROLL_DOWN_X_MAX = 270, 290
-    BULLETIN_CONTENT_SCROLL_DOWN_Y_MIN, BULLETIN_CONTENT_SCROLL_DOWN_Y_MAX = 95, 110
-
-    BULLETIN_LIST_SCROLL_UP_X_MIN, BULLETIN_LIST_SCROLL_UP_X_MAX = 270, 290
-    BULLETIN_LIST_SCROLL_UP_Y_MIN, BULLETIN_LIST_SCROLL_UP_Y_MAX = 20, 35
-
-    BULLETIN_LIST_SCROLL_DOWN_X_MIN, BULLETIN_LIST_SCROLL_DOWN_X_MAX = 270, 290
-    BULLETIN_LIST_SCROLL_DOWN_Y_MIN, BULLETIN_LIST_SCROLL_DOWN_Y_MAX = 95, 110
-    
-    BULLETIN_ITEM_SELECT_AREA_X_MAX = 265
+    # Block on INT edges while idle if the kernel supports it, instead of spinning
+    wait_for_touch_edge = _open_touch_int_edge(touch.INT)
 
-
-    def _is_touch_in_area(x, y, x_min, x_max, y_min, y_max):
-        return x_min <= x <= x_max and y_min <= y <= y_max
+    # Hitboxes for the current screen state, swapped whenever a touch changes it
+    active_hitboxes = _active_hitbox_table()
 
     # --- Helper function for bulletin screen interactions ---
-    def _handle_bulletin_interactions(x, y):
-        nonlocal last_touch_time # To update it if action is taken
+    def _handle_bulletin_action(action):
+        global bulletin_selected_item, bulletin_content_scroll_position, force_full_refresh
+        global bulletin_scroll_position
+
+        if action == TOUCH_BACK:
+            bulletin_selected_item = None
+            bulletin_content_scroll_position = 0
+            force_full_refresh = True
+        elif action == TOUCH_CONTENT_SCROLL_UP:
+            bulletin_content_scroll_position -= 1
+        elif action == TOUCH_CONTENT_SCROLL_DOWN:
+            bulletin_content_scroll_position += 2 # Scroll 2 lines
+        elif action == TOUCH_LIST_SCROLL_UP:
+            bulletin_scroll_position -= 1
+        elif action == TOUCH_LIST_SCROLL_DOWN:
+            bulletin_scroll_position += 1
+        return True
+
+    def _handle_bulletin_item_select(x, y):
         global bulletin_selected_item, bulletin_content_scroll_position, force_full_refresh
-        global bulletin_scroll_position, bulletin_items, touch_event
 
-        action_taken = False
-        current_time_val = time.time() # Get current time for potential update
+        if bulletin_selected_item is not None or x > BULLETIN_ITEM_SELECT_AREA_X_MAX or not bulletin_items:
+            return False
 
-        if bulletin_selected_item is not None:  # Viewing an item's content
-            # Back button (scrolled content)
-            if bulletin_content_scroll_position > 0 and _is_touch_in_area(x,y, BULLETIN_BACK_BUTTON_SCROLLED_X_MIN, BULLETIN_BACK_BUTTON_SCROLLED_X_MAX, BULLETIN_BACK_BUTTON_SCROLLED_Y_MIN, BULLETIN_BACK_BUTTON_SCROLLED_Y_MAX):
-                bulletin_selected_item = None
-                bulletin_content_scroll_position = 0
-                force_full_refresh = True
-                action_taken = True
-            # Back button (top of content)
-            elif bulletin_content_scroll_position == 0 and _is_touch_in_area(x,y, BULLETIN_BACK_BUTTON_TOP_X_MIN, BULLETIN_BACK_BUTTON_TOP_X_MAX, BULLETIN_BACK_BUTTON_TOP_Y_MIN, BULLETIN_BACK_BUTTON_TOP_Y_MAX):
-                bulletin_selected_item = None
-                bulletin_content_scroll_position = 0
-                force_full_refresh = True
-                action_taken = True
-            # "Return to List" button at bottom
-            elif _is_touch_in_area(x,y, BULLETIN_RETURN_TO_LIST_BOTTOM_X_MIN, BULLETIN_RETURN_TO_LIST_BOTTOM_X_MAX, BULLETIN_RETURN_TO_LIST_BOTTOM_Y_MIN, BULLETIN_RETURN_TO_LIST_BOTTOM_Y_MAX):
-                bulletin_selected_item = None
+        item_tops, item_bottoms = BULLETIN_ITEM_HIT_REGIONS[bulletin_scroll_position > 0]
+        i = bisect.bisect_left(item_bottoms, y) # First row whose bottom edge is at or below the touch
+        if i < len(item_tops) and item_tops[i] <= y:
+            select_index = bulletin_scroll_position + i
+            if 0 <= select_index < len(bulletin_items):
+                bulletin_selected_item = select_index
                 bulletin_content_scroll_position = 0
                 force_full_refresh = True
-                action_taken = True
-            # Content scroll up
-            elif bulletin_content_scroll_position > 0 and _is_touch_in_area(x,y, BULLETIN_CONTENT_SCROLL_UP_X_MIN, BULLETIN_CONTENT_SCROLL_UP_X_MAX, BULLETIN_CONTENT_SCROLL_UP_Y_MIN, BULLETIN_CONTENT_SCROLL_UP_Y_MAX):
-                bulletin_content_scroll_position -= 1
-                action_taken = True
-            # Content scroll down
-            elif _is_touch_in_area(x,y, BULLETIN_CONTENT_SCROLL_DOWN_X_MIN, BULLETIN_CONTENT_SCROLL_DOWN_X_MAX, BULLETIN_CONTENT_SCROLL_DOWN_Y_MIN, BULLETIN_CONTENT_SCROLL_DOWN_Y_MAX):
-                bulletin_content_scroll_position += 2 # Scroll 2 lines
-                action_taken = True
-        else:  # Viewing the list of bulletin items
-            # List scroll up
-            if bulletin_scroll_position > 0 and _is_touch_in_area(x,y, BULLETIN_LIST_SCROLL_UP_X_MIN, BULLETIN_LIST_SCROLL_UP_X_MAX, BULLETIN_LIST_SCROLL_UP_Y_MIN, BULLETIN_LIST_SCROLL_UP_Y_MAX):
-                bulletin_scroll_position -= 1
-                action_taken = True
-            # List scroll down
-            elif _is_touch_in_area(x,y, BULLETIN_LIST_SCROLL_DOWN_X_MIN, BULLETIN_LIST_SCROLL_DOWN_X_MAX, BULLETIN_LIST_SCROLL_DOWN_Y_MIN, BULLETIN_LIST_SCROLL_DOWN_Y_MAX):
-                bulletin_scroll_position += 1
-                action_taken = True
-            # Item selection
-            elif x <= BULLETIN_ITEM_SELECT_AREA_X_MAX and bulletin_items:
-                start_y = 25 if bulletin_scroll_position > 0 else 45 # Copied from original logic
-                item_height_plus_spacing = 33 # Approx height + spacing
-                items_on_screen = 4 if bulletin_scroll_position > 0 else 3
-
-                for i in range(items_on_screen):
-                    item_top = start_y + (i * item_height_plus_spacing) - 3
-                    item_bottom = item_top + 25 # Approx item clickable height
-                    if item_top <= y <= item_bottom:
-                        select_index = bulletin_scroll_position + i
-                        if 0 <= select_index < len(bulletin_items):
-                            bulletin_selected_item = select_index
-                            bulletin_content_scroll_position = 0
-                            force_full_refresh = True
-                            action_taken = True
-                            break
-        
-        if action_taken:
-            last_touch_time = current_time_val
-            touch_event.set()
-        return action_taken
+                return True
+        return False
 
     # --- Helper function for main navigation ---
-    def _handle_main_navigation_press(x, y):
-        nonlocal last_touch_time
-        global current_screen, force_full_refresh, touch_event
+    def _handle_next_screen():
+        global current_screen, force_full_refresh
         global bulletin_scroll_position, bulletin_selected_item, bulletin_content_scroll_position
 
-        action_taken = False
-        current_time_val = time.time()
-
-        nav_button_pressed = False
-        if current_screen == TIMETABLE_SCREEN and \
-           _is_touch_in_area(x, y, NAV_BUTTON_TIMETABLE_X_MIN, NAV_BUTTON_TIMETABLE_X_MAX, NAV_BUTTON_TIMETABLE_Y_MIN, NAV_BUTTON_TIMETABLE_Y_MAX):
-            nav_button_pressed = True
-        elif current_screen == BULLETIN_SCREEN and \
-             _is_touch_in_area(x, y, NAV_BUTTON_BULLETIN_X_MIN, NAV_BUTTON_BULLETIN_X_MAX, NAV_BUTTON_BULLETIN_Y_MIN, NAV_BUTTON_BULLETIN_Y_MAX):
-            nav_button_pressed = True
-        elif current_screen not in [TIMETABLE_SCREEN, BULLETIN_SCREEN] and \
-             _is_touch_in_area(x, y, NAV_BUTTON_COMMON_X_MIN, NAV_BUTTON_COMMON_X_MAX, NAV_BUTTON_COMMON_Y_MIN, NAV_BUTTON_COMMON_Y_MAX):
-            nav_button_pressed = True
-
-        if nav_button_pressed:
-            action_taken = True
-            old_screen = current_screen
-
-            if current_screen == BULLETIN_SCREEN:
-                bulletin_scroll_position = 0
-                bulletin_selected_item = None
-                bulletin_content_scroll_position = 0
-            
-            # Cycle through screens
-            if current_screen == NETWORK_INFO_SCREEN: current_screen = MAIN_SCREEN
-            elif current_screen == MAIN_SCREEN: current_screen = TIMETABLE_SCREEN
-            elif current_screen == TIMETABLE_SCREEN: current_screen = BULLETIN_SCREEN
-            else:  # Was BULLETIN_SCREEN
-                current_screen = NETWORK_INFO_SCREEN
-            
-            force_full_refresh = (old_screen == BULLETIN_SCREEN or current_screen == BULLETIN_SCREEN)
+        old_screen = current_screen
+
+        if current_screen == BULLETIN_SCREEN:
+            bulletin_scroll_position = 0
+            bulletin_selected_item = None
+            bulletin_content_scroll_position = 0
         
-        if action_taken:
-            last_touch_time = current_time_val
-            touch_event.set()
-        return action_taken
+        # Cycle through screens
+        if current_screen == NETWORK_INFO_SCREEN: current_screen = MAIN_SCREEN
+        elif current_screen == MAIN_SCREEN: current_screen = TIMETABLE_SCREEN
+        elif current_screen == TIMETABLE_SCREEN: current_screen = BULLETIN_SCREEN
+        else:  # Was BULLETIN_SCREEN
+            current_screen = NETWORK_INFO_SCREEN
+        
+        force_full_refresh = (old_screen == BULLETIN_SCREEN or current_screen == BULLETIN_SCREEN)
+        return True
 
     # --- Main touch detection loop ---
     while touch_thread_running:
@@ -493,22 +1097,37 @@ def touch_detection_thread():
                 current_time = time.time()
                 if touch_dev.TouchCount > 0 and (current_time - last_touch_time > debounce_time):
                     x_pos, y_pos = touch_dev.X[0], touch_dev.Y[0]
-                    
-                    processed_by_bulletin_interaction = False
-                    if current_screen == BULLETIN_SCREEN:
-                        if _handle_bulletin_interactions(x_pos, y_pos):
-                            processed_by_bulletin_interaction = True
-                    if not processed_by_bulletin_interaction: # Only try navigation if bulletin internal action wasn't primary
-                         _handle_main_navigation_press(x_pos, y_pos)
-                    elif current_screen == BULLETIN_SCREEN : # If bulletin interaction happened, still check its specific nav button
-                        _handle_main_navigation_press(x_pos, y_pos)
 
+                    # Only the hitboxes visible right now are tested; the first one containing the touch wins
+                    action = None
+                    for x_min, x_max, y_min, y_max, hit_action in active_hitboxes:
+                        if x_min <= x_pos <= x_max and y_min <= y_pos <= y_max:
+                            action = hit_action
+                            break
+
+                    if action == TOUCH_NEXT_SCREEN:
+                        action_taken = _handle_next_screen()
+                    elif action is not None:
+                        action_taken = _handle_bulletin_action(action)
+                    elif current_screen == BULLETIN_SCREEN:
+                        action_taken = _handle_bulletin_item_select(x_pos, y_pos)
+                    else:
+                        action_taken = False
+
+                    if action_taken:
+                        last_touch_time = current_time
+                        active_hitboxes = _active_hitbox_table()
+                        touch_event.set()
+                        wake_event.set()
 
                 touch_dev.Touch = 0 # Reset touch flag
                 time.sleep(0.05)  # Small delay
             else:
                 touch_dev.Touch = 0
-                time.sleep(0.01)  # Short sleep when no touch
+                if wait_for_touch_edge is not None:
+                    wait_for_touch_edge(TOUCH_IDLE_WAIT)  # Sleep in the kernel until a touch starts
+                else:
+                    time.sleep(0.01)  # Short sleep when no touch
                 
         except Exception as e:
             logging.error(f"Touch error: {e}")
@@ -520,80 +1139,129 @@ def touch_detection_thread():
 def draw_network_info_screen(fonts, network_info):
     """Draw the network information screen"""
     font_lg, font_md, font_sm, font_xs = fonts  # Updated to unpack 4 fonts
-    image = Image.new('1', (epd.height, epd.width), 255)
-    draw = ImageDraw.Draw(image)
-    
-    # Title
-    draw.text((10, 10), "Network Information", font=font_md, fill=0)
+    image = reuse_screen_image(NETWORK_INFO_SCREEN, _screen_template(NETWORK_INFO_SCREEN, fonts))  # Title and button already drawn
     
     # WiFi Network
-    draw.text((10, 40), f"WiFi: {network_info['wifi']}", font=font_sm, fill=0)
+    draw_text(image, (10, 40), f"WiFi: {network_info['wifi']}", font=font_sm, fill=0)
     
     # IP Address
-    draw.text((10, 60), f"IP: {network_info['ip']}", font=font_sm, fill=0)
+    draw_text(image, (10, 60), f"IP: {network_info['ip']}", font=font_sm, fill=0)
     
     # Hostname
-    draw.text((10, 80), f"Host: {network_info['hostname']}", font=font_sm, fill=0)
-    
-    # Draw button
-    draw.rectangle([(250, 0), (295, 127)], outline=0)
-    draw.text((255, 60), "Next", font=font_sm, fill=0)
-    
-    # Apply rotation if needed
-    if config.get('display_rotation') == 180:
-        image = image.rotate(180)
+    draw_text(image, (10, 80), f"Host: {network_info['hostname']}", font=font_sm, fill=0)
     
     return image
 
-def draw_timetable_screen(fonts, timetable_data, current_time=None, current_date=None):
-    """Draw the timetable screen with week/schedule info on left and timetable on right"""
-    font_lg, font_md, font_sm, font_xs = fonts  # Add extra small font
-    image = Image.new('1', (epd.height, epd.width), 255)
-    draw = ImageDraw.Draw(image)
-    
-    # Get current time and date if not provided
-    if current_time is None or current_date is None:
-        now = time.localtime()
-        current_time = time.strftime("%H:%M", now)
-        current_date = time.strftime("%d/%m/%Y", now)
-    
-    # Create a header with time and date in a top bar
-    draw.rectangle([(0, 0), (epd.height, 15)], outline=0, fill=0)
-    draw.text((5, 1), current_time, font=font_sm, fill=255)  # Back to original smaller font
-    draw.text((epd.height//2 - 10, 1), "|", font=font_sm, fill=255)
-    draw.text((epd.height//2, 1), current_date, font=font_sm, fill=255)
-    
-    # Make the Next button smaller and more stylish in the top right
-    draw.rectangle([(270, 0), (295, 15)], outline=0, fill=0)
-    draw.text((273, 1), "Next", font=font_xs, fill=255)
-    
-    # Define left and right section areas
-    left_section_width = 100  # Width for the left section
-    right_section_start = left_section_width + 5  # Start of the right section
-    
-    # Draw a vertical divider between sections
-    draw.line([(left_section_width, 20), (left_section_width, 127)], fill=0, width=1)
+# (fonts, timetable_data, layout) for the last timetable that was laid out
+_timetable_layout_cache = (None, None, None)
+
+def _get_timetable_layout(fonts, timetable_data):
+    """Precompute everything about the timetable screen that doesn't depend on the clock.
+
+    The schedule only changes when the timetable is refreshed, so the row strings,
+    their vertical offsets and the class start times are worked out once per
+    timetable_data and reused for every redraw until it changes.
+    """
+    global _timetable_layout_cache
+    cached_fonts, cached_data, cached_layout = _timetable_layout_cache
+    if cached_data is timetable_data and cached_fonts is fonts:
+        return cached_layout
+
+    font_lg, font_md, font_sm, font_xs = fonts
+    row_height = TIMETABLE_ROW_HEIGHT
+
+    # Weekend: first class of the next school day
+    first_class = None
+    if timetable_data.get("is_weekend", False):
+        for period in range(1, 6):
+            period_classes = timetable_data.get("next_schedule", {}).get(str(period))
+            if period_classes:
+                first_class = (period_classes[0].get('time', '??:??'),
+                               fit_text(period_classes[0].get('class', 'Free Period'), font_xs, 92))
+                break
+
+    # Weekday: start times in minutes, in period order, for the next-lesson lookup
+    start_mins = []
+    upcoming = []
+    for period in range(1, 6):
+        period_classes = timetable_data.get("schedule", {}).get(str(period), [])
+        if period_classes:
+            class_time = period_classes[0].get('time', '00:00')
+            try:
+                hour, minute = map(int, class_time.split(':'))
+            except ValueError:
+                continue
+            next_class = period_classes[0].get('class', 'Free Period')
+            next_class = fit_text(next_class, font_xs, 92)  # Truncate if too wide for the left side
+            start_mins.append(hour * 60 + minute)
+            upcoming.append((f"P{period} at {class_time}", next_class))
+
+    # Right section rows: (class text, its y); the period labels are part of the template
+    if timetable_data.get("is_weekend", False):
+        schedule = timetable_data.get("next_schedule", {})
+    else:
+        schedule = timetable_data.get("schedule", {})
+    rows = []
+    for period in TIMETABLE_PERIODS:
+        period_classes = schedule.get(str(period), [])
+
+        if period_classes:
+            class_name = period_classes[0].get('class', 'Free Period')
+            class_time = period_classes[0].get('time', '??:??')
+            class_display = f"{class_name} ({class_time})"
+            class_display = fit_text(class_display, font_sm, 145)  # Truncate if too wide for the row
+        else:
+            class_display = "Free"
+        class_height = _text_height(font_sm, class_display)
+        class_dy = (row_height - class_height) // 2
+
+        row_y = TIMETABLE_TOP + (period - 1) * row_height
+        rows.append((class_display, row_y + class_dy))
+
+    layout = {
+        'first_class': first_class,
+        'start_mins': start_mins,
+        'upcoming': upcoming,
+        'rows': tuple(rows),
+    }
+    _timetable_layout_cache = (fonts, timetable_data, layout)
+    return layout
+
+# (key, image) for the timetable screen with everything but the clock drawn
+_timetable_base_cache = (None, None)
+# What the timetable frame image was last drawn from, so an unchanged redraw can return it as is
+_timetable_frame_key = None
+
+def _draw_timetable_base(fonts, timetable_data, layout, next_index):
+    """Timetable screen without the time and date, cached until the schedule or next lesson changes"""
+    global _timetable_base_cache
+    cached_key, cached_image = _timetable_base_cache
+    if cached_key is not None and cached_key[0] is timetable_data and cached_key[1:] == (fonts, next_index):
+        return cached_image
+
+    font_lg, font_md, font_sm, font_xs = fonts
+    image = new_screen_image(TIMETABLE_SCREEN, fonts)  # Top bar, Next button, divider and period rows already drawn
     
     # LEFT SECTION: Week info and next lesson
     left_y = 22  # Starting Y position for left section
     
     # Week and Day information - use smaller font
     week_day_text = f"Week {timetable_data['week']}"
-    draw.text((5, left_y), week_day_text, font=font_sm, fill=0)
+    draw_text(image, (5, left_y), week_day_text, font=font_sm, fill=0)
     left_y += 15
     
     # Day of week - use smaller font
     day_text = f"{timetable_data['day']}"
-    draw.text((5, left_y), day_text, font=font_sm, fill=0)
+    draw_text(image, (5, left_y), day_text, font=font_sm, fill=0)
     left_y += 15
     
     # Add "Tomorrow" on a new line if showing next day's schedule
     if timetable_data.get("is_next_day", False):
-        draw.text((5, left_y), "(Tomorrow)", font=font_sm, fill=0)
+        draw_text(image, (5, left_y), "(Tomorrow)", font=font_sm, fill=0)
         left_y += 15
     
     # Display next lesson information
-    draw.text((5, left_y), "Next:", font=font_sm, fill=0)
+    draw_text(image, (5, left_y), "Next:", font=font_sm, fill=0)
     left_y += 15
     
     # If it's a weekend, show next school day
@@ -601,150 +1269,152 @@ def draw_timetable_screen(fonts, timetable_data, current_time=None, current_date
         next_day_text = f"Week {timetable_data.get('next_week', '?')}"
         next_day_text += f", {timetable_data.get('next_day', 'Monday')}"
         
-        draw.text((5, left_y), next_day_text, font=font_sm, fill=0)
+        draw_text(image, (5, left_y), next_day_text, font=font_sm, fill=0)
         left_y += 15
         
-        if "next_schedule" in timetable_data and timetable_data["next_schedule"]:
+        first_time, first_class = layout['first_class'] or (None, None)
+        if first_class:
             # Show first class of next day
-            first_class = None
-            for period in range(1, 6):
-                period_str = str(period)
-                if period_str in timetable_data["next_schedule"]:
-                    period_classes = timetable_data["next_schedule"][period_str]
-                    if period_classes:
-                        first_class = period_classes[0].get('class', 'Free Period')
-                        first_time = period_classes[0].get('time', '??:??')
-                        break
-            
-            if first_class:
-                draw.text((5, left_y), f"{first_time}", font=font_sm, fill=0)
-                left_y += 15
-                draw.text((5, left_y), first_class, font=font_xs, fill=0)
-    else:
-        # Determine next lesson for today
-        current_period = 0
-        next_period = None
-        next_class = None
-        next_time = None
-        
-        # Get current schedule
-        schedule = timetable_data.get("schedule", {})
-        
-        # Find next class based on current time
-        current_hour = int(time.strftime("%H"))
-        current_minute = int(time.strftime("%M"))
-        current_time_mins = current_hour * 60 + current_minute
+            draw_text(image, (5, left_y), f"{first_time}", font=font_sm, fill=0)
+            left_y += 15
+            draw_text(image, (5, left_y), first_class, font=font_xs, fill=0)
+    elif next_index < len(layout['upcoming']):
+        # Show next class information with smaller font and vertically aligned
+        next_text, next_class = layout['upcoming'][next_index]
+        draw_text(image, (5, left_y), next_text, font=font_sm, fill=0)
+        left_y += 15
         
-        for period in range(1, 6):
-            period_str = str(period)
-            period_classes = schedule.get(period_str, [])
-            
-            if period_classes:
-                class_time = period_classes[0].get('time', '00:00')
-                try:
-                    hour, minute = map(int, class_time.split(':'))
-                    class_time_mins = hour * 60 + minute
-                    
-                    # If class time is in the future, it's the next class
-                    if class_time_mins > current_time_mins:
-                        if next_period is None:
-                            next_period = period
-                            next_class = period_classes[0].get('class', 'Free Period')
-                            next_time = class_time
-                            break
-                except ValueError:
-                    pass
+        # Draw class name with vertical alignment
+        draw_text(image, (5, left_y), next_class, font=font_xs, fill=0)
+    else:
+        # No more classes today
+        no_more_text = "No more"
+        draw_text(image, (5, left_y), no_more_text, font=font_sm, fill=0)
+        left_y += 15
         
-        if next_period:
-            # Show next class information with smaller font and vertically aligned
-            next_text = f"P{next_period} at {next_time}"
-            draw.text((5, left_y), next_text, font=font_sm, fill=0)
-            left_y += 15
-            
-            # Draw class name with vertical alignment
-            if len(next_class) > 15:  # Truncate if too long for the left side
-                next_class = next_class[:12] + "..."
-            draw.text((5, left_y), next_class, font=font_xs, fill=0)
-        else:
-            # No more classes today
-            no_more_text = "No more"
-            draw.text((5, left_y), no_more_text, font=font_sm, fill=0)
-            left_y += 15
-            
-            # Vertical alignment not as important here, but keep consistent spacing
-            draw.text((5, left_y), "classes today", font=font_xs, fill=0)
+        # Vertical alignment not as important here, but keep consistent spacing
+        draw_text(image, (5, left_y), "classes today", font=font_xs, fill=0)
     
-    # RIGHT SECTION: Timetable 
-    right_y = 22  # Starting Y position for right section
+    # RIGHT SECTION: Timetable - row backgrounds and period numbers come from the template
+    for class_display, class_y in layout['rows']:
+        # Place class (or "Free") text horizontally offset but at same vertical alignment as period
+        draw_text(image, (TIMETABLE_RIGHT_X + 40, class_y), class_display, font=font_sm, fill=0)
     
-    # Get appropriate schedule
-    if timetable_data.get("is_weekend", False):
-        schedule = timetable_data.get("next_schedule", {})
-    elif timetable_data.get("is_next_day", False):
-        # If we're showing the next day's schedule (after cutoff time on weekday)
-        schedule = timetable_data.get("schedule", {})
-    else:
-        schedule = timetable_data.get("schedule", {})
+    _timetable_base_cache = ((timetable_data, fonts, next_index), image)
+    return image
+
+def draw_timetable_screen(fonts, timetable_data, current_time=None, current_date=None, now=None):
+    """Draw the timetable screen with week/schedule info on left and timetable on right"""
+    global _timetable_frame_key
+    font_lg, font_md, font_sm, font_xs = fonts  # Add extra small font
+    layout = _get_timetable_layout(fonts, timetable_data)
     
-    # Draw timetable periods - keep period numbers large, but class names smaller
-    for period in range(1, 6):
-        period_str = str(period)
-        period_classes = schedule.get(period_str, [])
-        
-        # Define row height and calculate vertical centering
-        row_height = 20  # Fixed row height
-        
-        # Calculate the period text metrics once
-        period_text = f"P{period}:"
-        period_bbox = font_md.getbbox(period_text)
-        period_height = period_bbox[3] - period_bbox[1]
-        
-        # Calculate vertical position to center the period text in the row
-        period_y = right_y + (row_height - period_height) // 2 - 5  # Shifted up by 20px
-        
-        # Background for each row (alternating) - precisely aligned with row
-        if period % 2 == 0:
-            draw.rectangle([(right_section_start, right_y), 
-                           (epd.height-5, right_y + row_height - 1)], outline=0, fill=255)
-        
-        # Draw period number with larger font at the centered position
-        draw.text((right_section_start + 5, period_y), period_text, font=font_md, fill=0)
-        
-        if period_classes:
-            class_name = period_classes[0].get('class', 'Free Period')
-            class_time = period_classes[0].get('time', '??:??')
-            
-            # Draw class name and time with smaller font
-            class_display = f"{class_name} ({class_time})"
-            if len(class_display) > 22:  # Truncate if too long
-                class_display = class_display[:20] + "..."
-            
-            # Calculate vertical center alignment for class text aligned with period text
-            class_bbox = font_sm.getbbox(class_display)
-            class_height = class_bbox[3] - class_bbox[1]
-            class_y = right_y + (row_height - class_height) // 2
-            
-            # Place class text horizontally offset but at same vertical alignment as period
-            draw.text((right_section_start + 40, class_y), class_display, font=font_sm, fill=0)
-        else:
-            # Free period text
-            free_text = "Free"
-            free_bbox = font_sm.getbbox(free_text)
-            free_height = free_bbox[3] - free_bbox[1]
-            free_y = right_y + (row_height - free_height) // 2
-            
-            # Place "Free" text at same vertical alignment as period
-            draw.text((right_section_start + 40, free_y), free_text, font=font_sm, fill=0)
-        
-        # Move to the next row
-        right_y += row_height
+    # One clock reading for the whole frame
+    if now is None:
+        now = datetime.now()
+    
+    # Get current time and date if not provided
+    if current_time is None or current_date is None:
+        current_time, current_date, _ = clock_strings(now)
     
-    # Apply rotation if needed
-    if config.get('display_rotation') == 180:
-        image = image.rotate(180)
+    # Determine next lesson for today: the first class starting after now
+    next_index = None
+    if not timetable_data.get("is_weekend", False):
+        current_time_mins = now.hour * 60 + now.minute
+        next_index = bisect.bisect_right(layout['start_mins'], current_time_mins)
+    
+    # The schedule only changes with the timetable and the next lesson, so only the clock is drawn per frame
+    base = _draw_timetable_base(fonts, timetable_data, layout, next_index)
+    frame = SCREEN_FRAMES.get(TIMETABLE_SCREEN)
+    if (frame is not None and _timetable_frame_key is not None and _timetable_frame_key[0] is base
+            and _timetable_frame_key[1:] == (current_time, current_date)):
+        return frame
+    image = reuse_screen_image(TIMETABLE_SCREEN, base)
+    
+    # Time and date in the top bar
+    draw_text(image, (5, 1), current_time, font=font_sm, fill=255)  # Back to original smaller font
+    draw_text(image, (epd.height//2, 1), current_date, font=font_sm, fill=255)
+    _timetable_frame_key = (base, current_time, current_date)
     
     return image
 
+# Background data thread - each source keeps only its latest result in a size-1 queue
+data_thread_running = True
+data_thread_wake = threading.Event()  # Set to make the data thread re-check its schedule now
+weather_queue = queue.Queue(maxsize=1)
+stats_queue = queue.Queue(maxsize=1)
+network_queue = queue.Queue(maxsize=1)
+timetable_queue = queue.Queue(maxsize=1)
+force_timetable_refresh = False  # Set to make the timetable source re-download on its next run
+
+def _put_latest(data_queue, value):
+    """Replace whatever is waiting in a size-1 queue with the newest value"""
+    try:
+        data_queue.get_nowait()
+    except queue.Empty:
+        pass
+    try:
+        data_queue.put_nowait(value)
+    except queue.Full:
+        pass
+    wake_event.set()
+
+def data_thread_function(sources):
+    """Run each (name, fetch, data_queue, interval) source every interval seconds
+    and publish its result to data_queue.
+
+    One thread serves every source: it sleeps until the earliest deadline, runs
+    whatever is due, then works out the next wake-up. Deadlines stay on a fixed
+    grid from a shared start instead of counting from when each fetch finished,
+    so sources whose intervals line up (weather and stats, say) are run together
+    in one wake-up rather than drifting apart.
+    """
+    logging.info("Data thread started")
+    start = time.monotonic()
+    deadlines = {name: start for name, _, _, _ in sources}  # Everything runs once straight away
+    while data_thread_running:
+        now = time.monotonic()
+        for name, fetch, data_queue, interval in sources:
+            if now < deadlines[name]:
+                continue
+            try:
+                _put_latest(data_queue, fetch())
+            except Exception as e:
+                logging.error(f"Data thread: error fetching {name}: {e}")
+            # Next slot on the grid; if a slow pass made us miss some, skip them
+            missed = (time.monotonic() - deadlines[name]) // interval
+            deadlines[name] += (missed + 1) * interval
+        
+        data_thread_wake.wait(max(min(deadlines.values()) - time.monotonic(), 0))
+        data_thread_wake.clear()
+    logging.info("Data thread exiting")
+
+def refresh_timetable(timetable_parser):
+    """Work out today's timetable for display, re-downloading first if a refresh was forced"""
+    global force_timetable_refresh
+    logging.info(f"Updating timetable data (forced: {force_timetable_refresh})")
+    if force_timetable_refresh:
+        timetable_parser.download_timetable(force=True)
+        timetable_parser.parse_timetable(force=True)
+        force_timetable_refresh = False
+    timetable_data = timetable_parser.get_schedule_for_display()
+    logging.info("Timetable updated: %s", timetable_data)
+    return timetable_data
+
+def start_data_thread(timetable_parser=None):
+    """Start the thread that refreshes weather, system stats and network info, plus the timetable if there is a parser"""
+    sources = [
+        ("Weather", get_weather, weather_queue, WEATHER_UPDATE_INTERVAL),
+        ("Stats", get_system_stats, stats_queue, STATS_UPDATE_INTERVAL),
+        ("Network", get_network_info, network_queue, NETWORK_UPDATE_INTERVAL),
+    ]
+    if timetable_parser is not None:
+        sources.append(("Timetable", functools.partial(refresh_timetable, timetable_parser),
+                        timetable_queue, TIMETABLE_UPDATE_INTERVAL))
+    thread = threading.Thread(target=data_thread_function, args=(sources,), daemon=True)
+    thread.start()
+    return thread
+
 # Bulletin thread variables
 bulletin_thread_running = True
 bulletin_queue = None
@@ -765,7 +1435,7 @@ def start_bulletin_thread():
         logging.info("Starting bulletin thread with imported function")
         thread = threading.Thread(
             target=bulletin_thread_function, 
-            args=(bulletin_queue, bulletin_thread_running),
+            args=(bulletin_queue, bulletin_thread_running, wake_event),
             daemon=True
         )
         thread.start()
@@ -775,8 +1445,34 @@ def start_bulletin_thread():
         logging.error("Bulletin thread function not available")
         return None
 
+def render_current_screen(fonts, now, weather_data, stats, network_info, timetable_data):
+    """Draw whichever screen is showing, from the latest data the main loop holds"""
+    if current_screen == NETWORK_INFO_SCREEN:
+        # network_info is kept up to date by the network thread
+        return draw_network_info_screen(fonts, network_info)
+    if current_screen == TIMETABLE_SCREEN:
+        if timetable_data is None:
+            # Fallback if timetable data is not available
+            logging.warning("Timetable data not available, showing network screen instead")
+            return draw_network_info_screen(fonts, network_info)
+        # Get current time and date for the top bar
+        current_time_str, current_date_str, _ = clock_strings(now)
+        return draw_timetable_screen(fonts, timetable_data, current_time_str, current_date_str, now=now)
+    if current_screen == BULLETIN_SCREEN:
+        # The bulletin thread keeps bulletin_items updated, nothing to fetch here
+        current_time_str, current_date_str, _ = clock_strings(now)
+        return draw_bulletin_screen(fonts, bulletin_items,
+                                    current_time=current_time_str,
+                                    current_date=current_date_str,
+                                    scroll_position=bulletin_scroll_position,
+                                    selected_item=bulletin_selected_item,
+                                    content_scroll_position=bulletin_content_scroll_position)
+    # Main screen - draw with latest time and stats
+    return draw_time_image(fonts, weather_data, stats, now=now)
+
 def main():
     global touch_thread_running, force_timetable_refresh, bulletin_thread_running, bulletin_queue
+    global data_thread_running, display_thread_running
     global bulletin_scroll_position, bulletin_selected_item, bulletin_content_scroll_position
     global bulletin_items, force_full_refresh  # Make variables global
     
@@ -785,18 +1481,15 @@ def main():
     
     # Initialize variables
     fonts = initialize_fonts()
-    last_weather_update = 0
-    weather_data = None
-    last_minute = int(time.strftime("%M"))
-    partial_refresh_count = 0
-    last_network_update = 0
-    network_update_interval = 300  # Update network info every 5 minutes
+    # Weather saved by the last run, until the data thread has a fresh one
+    weather_data = _weather_cache[2] if _weather_cache[1] == config.get('temperature_unit', 'C') else None
+    last_minute = datetime.now().minute
     force_timetable_refresh = False
     force_full_refresh = False
     
     # Initialize bulletin variables
     bulletin_items = []  # Initialize as empty list
-    bulletin_queue = queue.Queue()  # Thread-safe queue for bulletin items
+    bulletin_queue = queue.Queue(maxsize=1)  # Thread-safe queue for bulletin items; only the newest batch matters
     bulletin_scroll_position = 0
     bulletin_selected_item = None
     bulletin_content_scroll_position = 0
@@ -804,7 +1497,6 @@ def main():
     # Initialize timetable variables
     timetable_parser = None
     timetable_data = None
-    last_timetable_update = 0
     
     # Try to initialize the timetable parser
     try:
@@ -812,7 +1504,6 @@ def main():
             timetable_parser = ICSParser(TIMETABLE_URL)
             if timetable_parser.download_timetable() and timetable_parser.parse_timetable():
                 timetable_data = timetable_parser.get_schedule_for_display()
-                last_timetable_update = current_time
                 logging.info(f"Timetable initialized: {timetable_data}")
             else:
                 logging.error("Failed to initialize timetable")
@@ -822,7 +1513,6 @@ def main():
     # Variables to track system stats changes
     last_stats = {'cpu_temp': None, 'mem_usage': None}
     stats_only_changed = False
-    last_stats_update = 0  # Track when we last updated stats
     
     # Initialize the touch controller
     touch.ICNT_Init()
@@ -835,7 +1525,10 @@ def main():
     # Prepare initial screen once - network info screen by default
     image = draw_network_info_screen(fonts, network_info)
     # Use display_Base only once for the first display
-    epd.display_Base(epd.getbuffer(image))
+    display_full(image)
+    
+    # Later frames are sent from a background thread so the loop keeps going during a refresh
+    start_display_thread()
     
     # Start touch detection thread
     touch_thread = threading.Thread(target=touch_detection_thread, daemon=True)
@@ -846,16 +1539,23 @@ def main():
     
     # Note: bulletin_queue is already initialized in start_bulletin_thread()
     
+    # Weather, stats, network info and the timetable are refreshed in the background from here on
+    start_data_thread(timetable_parser)
+    
     try:
         while True:
-            current_time = time.time()
+            # Single wall-clock snapshot shared by everything drawn this tick
+            now = datetime.now()
             
-            # Update system stats periodically rather than every cycle
+            # Pick up new system stats from the data thread, if any
             stats_updated = False
-            if current_time - last_stats_update > STATS_UPDATE_INTERVAL:
+            try:
+                new_stats = stats_queue.get_nowait()
+            except queue.Empty:
+                new_stats = None
+            if new_stats is not None:
                 try:
-                    stats = get_system_stats()
-                    last_stats_update = current_time
+                    stats = new_stats
                     stats_updated = True
                     
                     # Check if only stats changed (not time or other content)
@@ -868,267 +1568,126 @@ def main():
                     last_stats = stats.copy()
                 except Exception as e:
                     logging.error(f"Error updating system stats: {e}")                    
-            # Update weather periodically
-            if current_time - last_weather_update > WEATHER_UPDATE_INTERVAL:
-                logging.info("Updating weather data")
-                weather_data = get_weather()
-                last_weather_update = current_time
+            # Pick up new weather and network info from the data thread, if any
+            try:
+                weather_data = weather_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                network_info = network_queue.get_nowait()
+            except queue.Empty:
+                pass
                 
-            # Update timetable periodically or when forced
-            if (timetable_parser is not None and 
-                (current_time - last_timetable_update > TIMETABLE_UPDATE_INTERVAL or force_timetable_refresh)):
-                logging.info(f"Updating timetable data (forced: {force_timetable_refresh})")
-                try:
-                    # Force download and parse if refresh button was pressed
-                    if force_timetable_refresh:
-                        timetable_parser.download_timetable(force=True)
-                        timetable_parser.parse_timetable(force=True)
-                        force_timetable_refresh = False
+            try:
+                new_timetable = timetable_queue.get_nowait()
+            except queue.Empty:
+                new_timetable = None
+            if new_timetable is not None:
+                timetable_data = new_timetable
                     
-                    timetable_data = timetable_parser.get_schedule_for_display()
-                    last_timetable_update = current_time
-                    logging.info(f"Timetable updated: {timetable_data}")
-                except Exception as e:
-                    logging.error(f"Error updating timetable: {e}")
-                    
-            # Check if there are new bulletin items in the queue
-            if not bulletin_queue.empty():
+            # Take the newest bulletin items, if the thread has queued any since the last pass
+            bulletin_updated = False
+            new_items = None
+            while True:
                 try:
-                    # Get the latest bulletin items from the queue
+                    # Drain everything so several updates cost only one redraw
                     new_items = bulletin_queue.get_nowait()
-                    # Only update bulletin_items if we actually got items
-                    if new_items:
-                        bulletin_items = new_items
-                        logging.info(f"Main thread: Retrieved {len(bulletin_items)} bulletin items from queue")
-                    else:
-                        logging.warning("Retrieved empty bulletin items list from queue")
-                except Exception as e:
-                    logging.error(f"Error retrieving bulletin items from queue: {e}")
-                    # Don't reset bulletin_items if there was an error, keep using existing items
-            
-            # Check for touch event
-            if touch_event.is_set():
-                touch_event.clear()
-                
-                # Redraw screen based on current screen state
-                if current_screen == NETWORK_INFO_SCREEN:
-                    # Only update network info if it's been more than the update interval
-                    if current_time - last_network_update > network_update_interval:
-                        logging.info("Updating network information")
-                        network_info = get_network_info()
-                        last_network_update = current_time
-                    
-                    image = draw_network_info_screen(fonts, network_info)
-                elif current_screen == TIMETABLE_SCREEN:
-                    # Timetable screen - use current timetable data
-                    if timetable_data is not None:
-                        # Get current time and date for the top bar
-                        now = time.localtime()
-                        current_time_str = time.strftime("%H:%M", now)
-                        current_date_str = time.strftime("%d/%m/%Y", now)
-                        
-                        image = draw_timetable_screen(fonts, timetable_data, current_time_str, current_date_str)
-                    else:
-                        # Fallback if timetable data is not available
-                        image = draw_network_info_screen(fonts, network_info)
-                        logging.warning("Timetable data not available, showing network screen instead")
-                elif current_screen == BULLETIN_SCREEN:
-                    # Bulletin screen - use the latest bulletin items from the thread
-                    # We don't need to fetch here as the thread will keep the data updated
-                    image = draw_bulletin_screen(fonts, bulletin_items,
-                                               scroll_position=bulletin_scroll_position,
-                                               selected_item=bulletin_selected_item,
-                                               content_scroll_position=bulletin_content_scroll_position)
-                else:
-                    # Main screen - draw with latest time and stats
-                    image = draw_time_image(fonts, weather_data, stats)
-                
-                # Increment partial refresh counter for screen transition
-                partial_refresh_count += 1
-                
-                # Do a full refresh much less frequently to protect the display
-                if partial_refresh_count >= PARTIAL_REFRESHES_BEFORE_FULL:
-                    logging.info(f"Full refresh after {PARTIAL_REFRESHES_BEFORE_FULL} partial refreshes")
-                    epd.display_Base(epd.getbuffer(image))
-                    partial_refresh_count = 0  # Reset counter
+                except queue.Empty:
+                    break
+            if new_items is not None:
+                # Only update bulletin_items if we actually got items
+                if new_items:
+                    bulletin_items = new_items
+                    bulletin_updated = True
+                    logging.info(f"Main thread: Retrieved {len(bulletin_items)} bulletin items from queue")
                 else:
-                    # Use partial refresh for most updates to protect the display
-                    logging.info(f"Partial refresh ({partial_refresh_count}/{PARTIAL_REFRESHES_BEFORE_FULL})")
-                    epd.display_Partial(epd.getbuffer(image))
-                continue
-            
-            # Update weather periodically
-            if current_time - last_weather_update > WEATHER_UPDATE_INTERVAL:
-                logging.info("Updating weather data")
-                weather_data = get_weather()
-                last_weather_update = current_time
+                    # Don't reset bulletin_items, keep using existing items
+                    logging.warning("Retrieved empty bulletin items list from queue")
             
             # Check for touch event
             if touch_event.is_set():
-                touch_event.clear()
+                # Wait for the touches to settle so one frame covers them all
+                wait_for_touches_to_settle()
                 
                 # Redraw screen based on current screen state
-                if current_screen == NETWORK_INFO_SCREEN:
-                    # Only update network info if it's been more than the update interval
-                    if current_time - last_network_update > network_update_interval:
-                        logging.info("Updating network information")
-                        network_info = get_network_info()
-                        last_network_update = current_time
-                    
-                    image = draw_network_info_screen(fonts, network_info)
-                    
-                    # Increment partial refresh counter for screen transition
-                    partial_refresh_count += 1
-                elif current_screen == TIMETABLE_SCREEN:
-                    # Timetable screen - draw with latest timetable data
-                    if timetable_data:
-                        image = draw_timetable_screen(fonts, timetable_data)
-                    else:
-                        # Fallback if timetable data is not available
-                        logging.warning("No timetable data available, showing network screen instead")
-                        image = draw_network_info_screen(fonts, network_info)
-                    
-                    # Increment partial refresh counter for screen transition
-                    partial_refresh_count += 1
-                elif current_screen == BULLETIN_SCREEN:
-                    # Bulletin screen - use the latest bulletin items from the thread
-                    # We don't need to fetch here as the thread will keep the data updated
-                    
-                    # Get current state before update
-                    previous_selected_item = bulletin_selected_item
-                    
-                    # Draw new bulletin screen image
-                    image = draw_bulletin_screen(fonts, bulletin_items,
-                                               scroll_position=bulletin_scroll_position,
-                                               selected_item=bulletin_selected_item,
-                                               content_scroll_position=bulletin_content_scroll_position)
-                    
-                    # Check if we entered or exited an article view
-                    if (previous_selected_item is None and bulletin_selected_item is not None) or \
-                       (previous_selected_item is not None and bulletin_selected_item is None):
-                        # Article selection state changed - use full refresh
-                        logging.info("Full refresh - entering or exiting bulletin article")
-                        epd.display_Base(epd.getbuffer(image))
-                        partial_refresh_count = 0  # Reset counter
-                    else:
-                        # Normal bulletin navigation - always use partial refresh
-                        logging.info("Partial refresh - bulletin navigation")
-                        epd.display_Partial(epd.getbuffer(image))
-                        # Don't increment partial_refresh_count for bulletin scrolling
-                else:
-                    # Main screen - draw with latest time and stats
-                    image = draw_time_image(fonts, weather_data, stats)
-                    
-                    # Increment partial refresh counter for screen transition
-                    partial_refresh_count += 1
+                image = render_current_screen(fonts, now, weather_data, stats, network_info, timetable_data)
                 
-                # Do a full refresh much less frequently to protect the display
-                # Exception for bulletin screen - we've already handled its refresh logic above
-                # Also force a full refresh when entering/leaving bulletin screen
                 if force_full_refresh:
-                    logging.info(f"Full refresh - entering or leaving bulletin screen")
-                    epd.display_Base(epd.getbuffer(image))
-                    partial_refresh_count = 0  # Reset counter
+                    # Entering/leaving the bulletin screen or one of its articles
+                    logging.info("Full refresh - entering or leaving bulletin screen or article")
+                    display_full(image)
                     force_full_refresh = False  # Reset flag
-                elif current_screen != BULLETIN_SCREEN and partial_refresh_count >= PARTIAL_REFRESHES_BEFORE_FULL:
-                    logging.info(f"Full refresh after {PARTIAL_REFRESHES_BEFORE_FULL} partial refreshes")
-                    epd.display_Base(epd.getbuffer(image))
-                    partial_refresh_count = 0  # Reset counter
-                elif current_screen != BULLETIN_SCREEN:
-                    # Use partial refresh for most updates to protect the display
-                    logging.info(f"Partial refresh ({partial_refresh_count}/{PARTIAL_REFRESHES_BEFORE_FULL})")
-                    epd.display_Partial(epd.getbuffer(image))
+                else:
+                    # Partial refresh; display_partial promotes it to a full one once enough has changed
+                    logging.debug("Partial refresh")
+                    display_partial(image)
                 continue
             
             # If on main screen, handle normal updates
             if current_screen == MAIN_SCREEN:
                 # Get current time components (do this once to avoid inconsistencies)
-                current_time_struct = time.localtime()
-                current_minute = current_time_struct.tm_min
-                current_second = current_time_struct.tm_sec
+                current_minute = now.minute
                 
-                # Check if time changed (minute change or within first 2 seconds of the same minute)
-                time_changed = current_minute != last_minute or (current_second < 2 and last_minute == current_minute)
+                # Check if time changed (last_minute only moves on once that minute has been drawn)
+                time_changed = current_minute != last_minute
                 
-                # Handle time updates (these count toward partial refresh counter)
+                # Handle time updates
                 if time_changed:
                     # Generate new image with updated time and latest stats
-                    image = draw_time_image(fonts, weather_data, stats)
+                    image = draw_time_image(fonts, weather_data, stats, now=now)
                     
-                    # Increment partial refresh counter since time changed
-                    partial_refresh_count += 1
-                    
-                    # Do a full refresh much less frequently to protect the display
-                    if partial_refresh_count >= PARTIAL_REFRESHES_BEFORE_FULL:
-                        logging.info(f"Full refresh after {PARTIAL_REFRESHES_BEFORE_FULL} partial refreshes")
-                        epd.display_Base(epd.getbuffer(image))
-                        partial_refresh_count = 0  # Reset counter
-                    else:
-                        logging.info(f"Partial refresh (time updated) ({partial_refresh_count}/{PARTIAL_REFRESHES_BEFORE_FULL})")
-                        epd.display_Partial(epd.getbuffer(image))
+                    logging.debug("Partial refresh (time updated)")
+                    display_partial(image)
                     
                     last_minute = current_minute
                 
-                # Handle just system stats updates (CPU/memory) - don't count toward refresh counter
+                # Handle just system stats updates (CPU/memory)
                 elif stats_only_changed and stats_updated:
                     # Generate new image with just updated stats
-                    image = draw_time_image(fonts, weather_data, stats)
+                    image = draw_time_image(fonts, weather_data, stats, now=now)
                     
-                    # Use partial refresh but don't increment the counter
-                    logging.info("Partial refresh (stats only) - not counting toward full refresh")
-                    epd.display_Partial(epd.getbuffer(image))
+                    logging.debug("Partial refresh (stats only)")
+                    display_partial(image)
             
             # Handle timetable screen time updates
             elif current_screen == TIMETABLE_SCREEN and timetable_data is not None:
                 # Get current time components
-                current_time_struct = time.localtime()
-                current_minute = current_time_struct.tm_min
-                current_second = current_time_struct.tm_sec
+                current_minute = now.minute
                 
                 # Check if time changed
-                time_changed = current_minute != last_minute or (current_second < 2 and last_minute == current_minute)
+                time_changed = current_minute != last_minute
                 
                 # Update the screen if time changed
                 if time_changed:
                     # Get formatted time and date for top bar
-                    current_time_str = time.strftime("%H:%M", current_time_struct)
-                    current_date_str = time.strftime("%d/%m/%Y", current_time_struct)
+                    current_time_str, current_date_str, _ = clock_strings(now)
                     
                     # Generate new image with updated time
-                    image = draw_timetable_screen(fonts, timetable_data, current_time_str, current_date_str)
+                    image = draw_timetable_screen(fonts, timetable_data, current_time_str, current_date_str, now=now)
                     
-                    # Increment partial refresh counter
-                    partial_refresh_count += 1
-                    
-                    # Do a full refresh if entering/leaving bulletin screen or periodically otherwise
+                    # Do a full refresh if entering/leaving bulletin screen
                     if force_full_refresh:
                         logging.info(f"Full refresh - entering or leaving bulletin screen")
-                        epd.display_Base(epd.getbuffer(image))
-                        partial_refresh_count = 0
+                        display_full(image)
                         force_full_refresh = False  # Reset flag
-                    elif current_screen != BULLETIN_SCREEN and partial_refresh_count >= PARTIAL_REFRESHES_BEFORE_FULL:
-                        logging.info(f"Full refresh after {PARTIAL_REFRESHES_BEFORE_FULL} partial refreshes")
-                        epd.display_Base(epd.getbuffer(image))
-                        partial_refresh_count = 0
                     else:
-                        logging.info(f"Partial refresh (timetable time updated) ({partial_refresh_count}/{PARTIAL_REFRESHES_BEFORE_FULL})")
-                        epd.display_Partial(epd.getbuffer(image))
+                        logging.debug("Partial refresh (timetable time updated)")
+                        display_partial(image)
                     
-                    last_minute = current_minute                # Handle bulletin screen updates
+                    last_minute = current_minute
+                
+            # Handle bulletin screen updates
             elif current_screen == BULLETIN_SCREEN:
                 # Get current time components for time updates
-                current_time_struct = time.localtime()
-                current_minute = current_time_struct.tm_min
-                current_second = current_time_struct.tm_sec
+                current_minute = now.minute
                 
                 # Check if time changed (minute change)
-                time_changed = current_minute != last_minute or (current_second < 2 and last_minute == current_minute)
+                time_changed = current_minute != last_minute
                 
                 # Update time display if needed
                 if time_changed:
                     # Get formatted time and date
-                    current_time_str = time.strftime("%H:%M", current_time_struct)
-                    current_date_str = time.strftime("%d/%m/%Y", current_time_struct)
+                    current_time_str, current_date_str, _ = clock_strings(now)
                     
                     # Redraw bulletin screen with updated time
                     image = draw_bulletin_screen(fonts, bulletin_items,
@@ -1138,36 +1697,55 @@ def main():
                                                 selected_item=bulletin_selected_item,
                                                 content_scroll_position=bulletin_content_scroll_position)
                     
-                    # Partial refresh when time changes - do NOT increment refresh counter
-                    epd.display_Partial(epd.getbuffer(image))
+                    # Partial refresh when time changes
+                    display_partial(image)
                     last_minute = current_minute
                 
-                # Just check if we have new bulletin items from the thread
-                elif not bulletin_queue.empty():
+                # Redraw if the thread delivered new bulletin items this pass
+                elif bulletin_updated:
                     try:
-                        # Get the latest bulletin items from the queue
-                        bulletin_items = bulletin_queue.get_nowait()
-                        
                         # Redraw bulletin screen with latest items
+                        current_time_str, current_date_str, _ = clock_strings(now)
                         image = draw_bulletin_screen(fonts, bulletin_items,
+                                                   current_time=current_time_str,
+                                                   current_date=current_date_str,
                                                    scroll_position=bulletin_scroll_position,
                                                    selected_item=bulletin_selected_item,
                                                    content_scroll_position=bulletin_content_scroll_position)
                         
-                        # Use partial refresh for bulletin updates - do NOT increment refresh counter
-                        epd.display_Partial(epd.getbuffer(image))
+                        # Use partial refresh for bulletin updates
+                        display_partial(image)
                     except Exception as e:
                         logging.error(f"Error updating bulletin screen: {e}")
             
-            time.sleep(REFRESH_INTERVAL)
+            # Nothing else changes on screen until the next minute, so sleep until then
+            # unless a touch or new data from a worker thread wakes us first
+            until_next_minute = 60 - now.second - now.microsecond / 1e6
+            wake_event.wait(max(until_next_minute, REFRESH_INTERVAL))
+            wake_event.clear()
 
     except KeyboardInterrupt:
         logging.info("Cleaning up and exiting")
         # Signal threads to exit
         touch_thread_running = False
         bulletin_thread_running = False
+        data_thread_running = False
+        data_thread_wake.set()
         time.sleep(0.5)  # Give threads time to exit
-        
+        touch_thread.join(TOUCH_IDLE_WAIT + 1)  # Off the INT epoll before it is closed
+        _close_touch_int_edge()
+
+        # Let the last frame finish and stop the display thread before the panel goes to sleep
+        display_thread_running = False
+        display_wake.set()
+        if not display_idle.wait(5):
+            logging.warning("Display still refreshing at shutdown, waiting for it")
+        display_thread.join(10)
+        if display_thread.is_alive():
+            # Putting the panel to sleep now would drive SPI from two threads at once
+            logging.warning("Display thread did not stop, leaving the panel awake")
+            sys.exit()
+
         # Properly shutdown the display without a full refresh
         epd.sleep()
         epd.Dev_exit()
@@ -1176,7 +1754,7 @@ def main():
 def draw_bulletin_screen(fonts, bulletin_items, current_time=None, current_date=None, scroll_position=0, selected_item=None, content_scroll_position=0):
     """Wrapper function to call the bulletin_utils version of draw_bulletin_screen"""
     # Add debug information
-    logging.info(f"Drawing bulletin screen with {len(bulletin_items)} items")
+    logging.debug("Drawing bulletin screen with %d items", len(bulletin_items))
     
     if render_bulletin_screen is not None:
         # Make sure to only pass the expected number of arguments
@@ -1190,10 +1768,6 @@ def draw_bulletin_screen(fonts, bulletin_items, current_time=None, current_date=
         _, _, font_sm, _ = fonts  # Only font_sm is used in the fallback implementation
         draw.text((10, 50), "Bulletin module not available", font=font_sm, fill=0)
         
-        # Apply rotation if needed
-        if config.get('display_rotation') == 180:
-            image = image.rotate(180)
-        
         return image
 
 # Add the entry point at the end of the file
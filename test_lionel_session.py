@@ -0,0 +1,34 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+import unittest
+
+import lionel_session
+
+FAILED_LOGIN_PAGE = b'''<html><body>
+<div class="alert alert-danger" role="alert">Invalid login, please try again</div>
+<form action="https://lionel2.kgv.edu.hk/login/index.php" method="post" id="login">
+<input type="hidden" name="logintoken" value="abc123">
+<input type="text" name="username" id="username" value="jdoe">
+<input type="password" name="password" id="password" value="">
+</form>
+</body></html>'''
+
+SIGNED_IN_PAGE = b'''<html><body>
+<span class="usertext mr-1">jdoe</span>
+</body></html>'''
+
+
+class HasUserMarkersTest(unittest.TestCase):
+    def test_username_echoed_in_failed_login_form_is_not_a_marker(self):
+        self.assertFalse(lionel_session._has_user_markers(FAILED_LOGIN_PAGE, "jdoe"))
+
+    def test_username_in_page_text_is_a_marker(self):
+        self.assertTrue(lionel_session._has_user_markers(SIGNED_IN_PAGE, "jdoe"))
+
+    def test_logout_link_is_a_marker(self):
+        page = b'<a href="/login/logout.php?sesskey=x">Log out</a>'
+        self.assertTrue(lionel_session._has_user_markers(page, "someone-else"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+"""Width-based text clipping shared by the main screens and the bulletin screen.
+
+Kept free of third-party imports so main.py can use it even when
+bulletin_utils cannot be imported.
+"""
+import array
+import functools
+
+@functools.lru_cache(maxsize=8)
+def _char_widths(font):
+    """Advance width of each printable ASCII character in font, indexed by ord()"""
+    return array.array('f', (font.getlength(chr(c)) if 32 <= c < 127 else 0.0 for c in range(128)))
+
+@functools.lru_cache(maxsize=256)
+def fit_text(text, font, max_px):
+    """Shorten text with "..." so it is at most max_px wide in font.
+
+    Uses the font's real advance widths, so proportional fonts are clipped at the
+    right place. The same strings are fitted every frame, so results are cached.
+    """
+    if font.getlength(text) <= max_px:
+        return text
+    if text.isascii() and text.isprintable():
+        # Estimate the cut from the per-character table, then confirm it with the
+        # real (kerned) width so the result matches a full search
+        widths = _char_widths(font)
+        budget = max_px - 3 * widths[46]  # room left after the "..."
+        cut = 0
+        for ch in text:
+            budget -= widths[ord(ch)]
+            if budget < 0:
+                break
+            cut += 1
+        while cut > 0 and font.getlength(text[:cut].rstrip() + "...") > max_px:
+            cut -= 1
+        while cut < len(text) and font.getlength(text[:cut + 1].rstrip() + "...") <= max_px:
+            cut += 1
+        return text[:cut].rstrip() + "..."
+    # Binary search for the longest prefix that still fits with the ellipsis
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if font.getlength(text[:mid].rstrip() + "...") <= max_px:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low].rstrip() + "..."
+